@@ -1,10 +1,230 @@
 import pandas as pd
 import yfinance as yf
+import numpy as np
+import time
+import os
+import functools
+from dataclasses import dataclass
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from file_cache import FileCache
+
+# History downloaded through get_history / get_daily_history is reused for this many seconds
+HISTORY_CACHE_TTL = 3600
+
+# The same downloads on disk, one file per (ticker, interval, period), so warm reruns and other worker
+# processes skip the network; intraday bars change during the session and are never read from disk
+HISTORY_DISK_CACHE_INTERVALS = ('1d', '5d', '1wk', '1mo', '3mo')
+HISTORY_CACHE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../data/cache/history"))
+_history_file_cache = FileCache(cache_dir=HISTORY_CACHE_DIR, ttl_seconds=HISTORY_CACHE_TTL)
+
+# Weekly bars built by resample_weekly, keyed by (ticker, first bar, last bar, length, last close, last volume)
+WEEKLY_CACHE_MAX_SIZE = 256
+_weekly_cache = {}
+
+# The same weekly bars on disk, one file per ticker holding (key, weekly bars), so warm reruns and other
+# worker processes skip the aggregation
+WEEKLY_CACHE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../data/cache/weekly"))
+_weekly_file_cache = FileCache(cache_dir=WEEKLY_CACHE_DIR, ttl_seconds=7 * 24 * 3600)
 
 def load_stock_list(file_path):
     return pd.read_csv(file_path, sep='\t', header=None, names=['ticker'])['ticker'].tolist()
 
+@dataclass
+class Bars:
+    """
+    Column arrays (structure of arrays) of one OHLCV frame for positional NumPy access.
+    """
+    ts: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    @classmethod
+    def from_frame(cls, data_frame):
+        """
+        Extract the OHLCV columns of a DataFrame into NumPy arrays.
+        
+        Args:
+            data_frame: DataFrame with Open/High/Low/Close/Volume columns and a DatetimeIndex
+        
+        Returns:
+            Bars instance (timestamps as int64 nanoseconds, prices as float64)
+        """
+        return cls(
+            ts=data_frame.index.as_unit('ns').asi8,
+            open=data_frame['Open'].to_numpy(dtype=np.float64),
+            high=data_frame['High'].to_numpy(dtype=np.float64),
+            low=data_frame['Low'].to_numpy(dtype=np.float64),
+            close=data_frame['Close'].to_numpy(dtype=np.float64),
+            volume=data_frame['Volume'].to_numpy()
+        )
+
+    def __len__(self):
+        return len(self.close)
+
+def gather_periods(values, signal_idx, periods_arr):
+    """
+    Gather values[signal + period] for every (signal, period) pair as a (signal, period) matrix.
+    
+    Args:
+        values: 1-D NumPy array of one column (e.g. Bars.close)
+        signal_idx: Integer positions of the signals, each with signal + max period inside values
+        periods_arr: Array of periods
+    
+    Returns:
+        NumPy array of shape (len(signal_idx), len(periods_arr))
+    """
+    return values[signal_idx[:, None] + periods_arr[None, :]]
+
+@functools.lru_cache(maxsize=256)
+def _get_history_cached(ticker, interval, period, ttl_bucket):
+    use_disk_cache = interval in HISTORY_DISK_CACHE_INTERVALS
+    # The file is overwritten on every refresh; FileCache treats it as expired by its modification time
+    cache_key = f"history:{ticker}:{interval}:{period}"
+    if use_disk_cache:
+        history = _history_file_cache.get(cache_key)
+        if history is not None:
+            return history
+    stock = yf.Ticker(ticker)
+    history = stock.history(interval=interval, period=period)
+    # Empty results are often transient download failures, so only keep real data on disk
+    if use_disk_cache and not history.empty:
+        _history_file_cache.set(cache_key, history)
+    return history
+
+def get_history(ticker, interval, period):
+    """
+    Download price history for a ticker, reusing recent downloads of the same (ticker, interval, period).
+    
+    Args:
+        ticker: Stock ticker symbol
+        interval: yfinance bar interval (e.g. '5m', '60m', '1d')
+        period: History period passed to yfinance (e.g. '60d', '2y')
+    
+    Returns:
+        DataFrame with OHLCV data (shared between callers, do not modify in place)
+    """
+    # Bucket the current time so long-running processes still refresh after HISTORY_CACHE_TTL
+    ttl_bucket = int(time.time() // HISTORY_CACHE_TTL)
+    return _get_history_cached(ticker, interval, period, ttl_bucket)
+
+def get_daily_history(ticker, period='1y'):
+    """
+    Download daily history for a ticker, reusing recent downloads of the same ticker.
+    
+    Args:
+        ticker: Stock ticker symbol
+        period: History period passed to yfinance (default: '1y')
+    
+    Returns:
+        DataFrame with daily OHLCV data (shared between callers, do not modify in place)
+    """
+    return get_history(ticker, '1d', period)
+
+def _resample_weekly_pandas(daily_data):
+    return daily_data.resample('W').agg({
+        'Open': 'first',
+        'High': 'max',
+        'Low': 'min',
+        'Close': 'last',
+        'Volume': 'sum'
+    })
+
+def _first_valid_per_group(values, starts, ends):
+    # First non-NaN value in each row group [start, end], NaN when the group has none
+    valid_pos = np.flatnonzero(~np.isnan(values))
+    first = np.searchsorted(valid_pos, starts, side='left')
+    pos = valid_pos[np.minimum(first, len(valid_pos) - 1)] if len(valid_pos) else starts
+    return np.where((first < len(valid_pos)) & (pos <= ends), values[pos], np.nan)
+
+def _last_valid_per_group(values, starts, ends):
+    # Last non-NaN value in each row group [start, end], NaN when the group has none
+    valid_pos = np.flatnonzero(~np.isnan(values))
+    last = np.searchsorted(valid_pos, ends, side='right') - 1
+    pos = valid_pos[np.maximum(last, 0)] if len(valid_pos) else ends
+    return np.where((last >= 0) & (pos >= starts), values[pos], np.nan)
+
+def resample_weekly(daily_data, ticker=None):
+    """
+    Aggregate daily OHLCV bars into weekly bars (weeks ending on Sunday, same as resample('W')).
+    
+    Args:
+        daily_data: DataFrame with daily OHLCV data and a sorted DatetimeIndex
+        ticker: Optional ticker symbol; when given the weekly frame is cached for the same daily bars
+    
+    Returns:
+        DataFrame with weekly OHLCV data (shared between callers when cached, do not modify in place)
+    """
+    if daily_data.empty:
+        return _resample_weekly_pandas(daily_data)
+    
+    key = None
+    if ticker is not None:
+        # The last bar's close and volume change while its day is still trading
+        last_bar = daily_data.iloc[-1]
+        key = (ticker, daily_data.index[0].value, daily_data.index[-1].value, len(daily_data),
+               float(last_bar['Close']), float(last_bar['Volume']))
+        if key in _weekly_cache:
+            return _weekly_cache[key]
+        # The file is overwritten whenever the daily bars change, so only use it if its key still matches
+        cached = _weekly_file_cache.get(f"weekly:{ticker}")
+        if cached is not None and cached[0] == key:
+            weekly = cached[1]
+            _store_weekly(key, weekly)
+            return weekly
+    
+    if not daily_data.index.is_monotonic_increasing:
+        # Week groups must be contiguous runs of rows for reduceat, so use pandas for unsorted data
+        weekly = _resample_weekly_pandas(daily_data)
+    else:
+        ohlc = daily_data[['Open', 'High', 'Low', 'Close']].to_numpy(dtype=np.float64)
+        volume = daily_data['Volume'].to_numpy()
+        if volume.dtype.kind == 'f':
+            volume = np.where(np.isnan(volume), 0, volume)  # resample's sum skips NaN
+        # Label every bar with the Sunday that closes its week, on local wall-clock time
+        tz = daily_data.index.tz
+        local_days = daily_data.index.tz_localize(None).normalize()
+        week_labels = local_days + pd.to_timedelta(6 - local_days.dayofweek, unit='D')
+        label_values = week_labels.asi8
+        edges = np.flatnonzero(np.diff(label_values, prepend=label_values[0] - 1))
+        last_rows = np.append(edges[1:], len(daily_data)) - 1
+        
+        # fmax/fmin and the first/last valid row skip NaN prices, like resample's aggregations
+        weekly = pd.DataFrame({
+            'Open': _first_valid_per_group(ohlc[:, 0], edges, last_rows),
+            'High': np.fmax.reduceat(ohlc[:, 1], edges),
+            'Low': np.fmin.reduceat(ohlc[:, 2], edges),
+            'Close': _last_valid_per_group(ohlc[:, 3], edges, last_rows),
+            'Volume': np.add.reduceat(volume, edges)
+        }, index=week_labels[edges])
+        
+        # Keep empty weeks in between, exactly like resample does
+        full_index = pd.date_range(week_labels[0], week_labels[-1], freq='W')
+        if len(full_index) != len(weekly):
+            weekly = weekly.reindex(full_index)
+            weekly['Volume'] = weekly['Volume'].fillna(0).astype(daily_data['Volume'].dtype)
+        weekly.index = pd.date_range(week_labels[0], week_labels[-1], freq='W', tz=tz, name=daily_data.index.name)
+    
+    if key is not None:
+        _store_weekly(key, weekly)
+        _weekly_file_cache.set(f"weekly:{ticker}", (key, weekly))
+    return weekly
+
+def _store_weekly(key, weekly):
+    """
+    Keep weekly bars in the in-process cache, dropping the oldest entry when it is full.
+    
+    Args:
+        key: Cache key built by resample_weekly
+        weekly: DataFrame with weekly OHLCV data
+    """
+    if len(_weekly_cache) >= WEEKLY_CACHE_MAX_SIZE:
+        _weekly_cache.pop(next(iter(_weekly_cache)))  # Drop the oldest entry
+    _weekly_cache[key] = weekly
+
 def truncate_data_to_date(data_frame, end_date):
     """
     Truncate DataFrame to only include data up to the specified end_date.
@@ -59,44 +279,25 @@ def download_stock_data(ticker, end_date=None):
                 truncate_data = False
     
     data_ticker = {}
-    stock = yf.Ticker(ticker)
     
-    # Define base timeframes to download directly (using original periods)
-    try:
-        # Get 5-minute data for short timeframes
-        # data_ticker['5m'] = stock.history(interval='5m', period='1mo')
-        data_ticker['5m'] = stock.history(interval='5m', period='60d')
-        if not data_ticker['5m'].empty:
-            print(f"Downloaded 5m data for {ticker}")
-        else:
-            print(f"No 5m data available for {ticker}")
-    except Exception as e:
-        print(f"Error downloading {ticker} 5m data: {e}")
-        data_ticker['5m'] = pd.DataFrame()
-    
-    try:
-        # Get 1-hour data for medium timeframes
-        # data_ticker['1h'] = stock.history(interval='60m', period='3mo')
-        data_ticker['1h'] = stock.history(interval='60m', period='2y')
-        if not data_ticker['1h'].empty:
-            print(f"Downloaded 1h data for {ticker}")
-        else:
-            print(f"No 1h data available for {ticker}")
-    except Exception as e:
-        print(f"Error downloading {ticker} 1h data: {e}")
-        data_ticker['1h'] = pd.DataFrame()
-    
-    try:
-        # Get daily data for long timeframes
-        # data_ticker['1d'] = stock.history(interval='1d', period='1y')
-        data_ticker['1d'] = stock.history(interval='1d', period='2y')
-        if not data_ticker['1d'].empty:
-            print(f"Downloaded 1d data for {ticker}")
-        else:
-            print(f"No 1d data available for {ticker}")
-    except Exception as e:
-        print(f"Error downloading {ticker} 1d data: {e}")
-        data_ticker['1d'] = pd.DataFrame()
+    # Define base timeframes to download directly (using original periods): key -> (yfinance interval, period)
+    base_downloads = {'5m': ('5m', '60d'), '1h': ('60m', '2y'), '1d': ('1d', '2y')}
+    
+    # The downloads are independent network requests, so overlap them instead of waiting on each in turn
+    with ThreadPoolExecutor(max_workers=len(base_downloads)) as executor:
+        futures = {interval_key: executor.submit(get_history, ticker, yf_interval, period)
+                   for interval_key, (yf_interval, period) in base_downloads.items()}
+    
+    for interval_key, future in futures.items():
+        try:
+            data_ticker[interval_key] = future.result()
+            if not data_ticker[interval_key].empty:
+                print(f"Downloaded {interval_key} data for {ticker}")
+            else:
+                print(f"No {interval_key} data available for {ticker}")
+        except Exception as e:
+            print(f"Error downloading {ticker} {interval_key} data: {e}")
+            data_ticker[interval_key] = pd.DataFrame()
     
     # Truncate data to end_date if backtesting mode is enabled
     if truncate_data:
@@ -121,13 +322,7 @@ def download_stock_data(ticker, end_date=None):
     
     # Create weekly data from daily data
     if not data_ticker['1d'].empty:
-        data_ticker['1w'] = data_ticker['1d'].resample('W').agg({
-            'Open': 'first',
-            'High': 'max',
-            'Low': 'min',
-            'Close': 'last',
-            'Volume': 'sum'
-        })
+        data_ticker['1w'] = resample_weekly(data_ticker['1d'], ticker)
     else:
         data_ticker['1w'] = pd.DataFrame()
     
@@ -137,8 +332,8 @@ def transform_1h_data(df_1h, new_interval = '2h'):
     if df_1h.empty:
         return pd.DataFrame()
     # 确保DatetimeIndex
-    df_1h.index = pd.to_datetime(df_1h.index)
-    df_1h.sort_index(inplace=True)  # 排序一下，以防万一
+    # Not in place: the input may be a cached download shared with other callers
+    df_1h = df_1h.set_axis(pd.to_datetime(df_1h.index)).sort_index()  # 排序一下，以防万一
 
     # ============== 2) 只保留日盘 (9:30-16:00) ==============
     #   如果你也想包括盘前/盘后，则可不做这步，或改成更广时间段
@@ -191,8 +386,8 @@ def transform_5m_data(df_5m, new_interval = '10m'):
     if df_5m.empty:
         return pd.DataFrame()
     # 确保DatetimeIndex
-    df_5m.index = pd.to_datetime(df_5m.index)
-    df_5m.sort_index(inplace=True)  # 排序一下，以防万一
+    # Not in place: the input may be a cached download shared with other callers
+    df_5m = df_5m.set_axis(pd.to_datetime(df_5m.index)).sort_index()  # 排序一下，以防万一
     
     # ============== 2) 只保留日盘 (9:30-16:00) ==============
     #   如果你也想包括盘前/盘后，则可不做这步，或改成更广时间段
@@ -115,6 +115,10 @@ def save_analysis_result(run_id: int, ticker: str, interval: str, result_type: s
     try:
         # Sanitize data for JSON (handle primitives, remove NaNs)
         def clean_nans(d):
+            # Most leaves of the result records are plain strings and ints; return them before the
+            # hasattr check below, which raises and swallows an AttributeError for each of them
+            if d is None or type(d) in (str, int, bool):
+                return d
             if isinstance(d, float) and (d != d or d == float('inf') or d == float('-inf')):
                 return None
             if isinstance(d, dict):
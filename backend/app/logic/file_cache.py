@@ -0,0 +1,84 @@
+import os
+import time
+import pickle
+import hashlib
+
+class FileCache:
+    """
+    Pickle-based file cache with a time-to-live, safe to share between worker processes.
+
+    Expired files are deleted by prune, which set runs at most once per time-to-live.
+    """
+
+    def __init__(self, cache_dir, ttl_seconds=3600):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self._last_prune = 0.0
+
+    def _path(self, key):
+        digest = hashlib.md5(key.encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.pkl")
+
+    def get(self, key):
+        """
+        Load a cached value.
+
+        Args:
+            key: Cache key string
+
+        Returns:
+            Cached value, or None if missing, expired or unreadable
+        """
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl_seconds:
+                return None
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def set(self, key, value):
+        """
+        Store a value under a key.
+
+        Args:
+            key: Cache key string
+            value: Picklable value to store
+        """
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            # Atomic rename so concurrent readers never see a partial file
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error writing cache entry {key}: {e}")
+        if time.time() - self._last_prune > self.ttl_seconds:
+            self.prune()
+
+    def prune(self):
+        """
+        Delete expired entries (and temporary files left behind by interrupted writes).
+
+        Returns:
+            Number of files deleted
+        """
+        self._last_prune = time.time()
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return 0
+        removed = 0
+        for name in names:
+            path = os.path.join(self.cache_dir, name)
+            try:
+                if self._last_prune - os.path.getmtime(path) > self.ttl_seconds:
+                    os.remove(path)
+                    removed += 1
+            except OSError:
+                # Another process replaced or deleted the file in the meantime
+                continue
+        return removed
@@ -1,8 +1,7 @@
 import pandas as pd
 import numpy as np
-from data_loader import download_stock_data
-from indicators import compute_cd_indicator, compute_mc_indicator
-import yfinance as yf
+from data_loader import download_stock_data, get_daily_history, resample_weekly, Bars, gather_periods
+from indicators import cached_cd_indicator, cached_mc_indicator
 
 # EMA warmup period - should match the value in indicators.py
 EMA_WARMUP_PERIOD = 0
@@ -10,32 +9,79 @@ EMA_WARMUP_PERIOD = 0
 # Maximum number of latest signals to process (to reduce noise from older signals)
 MAX_SIGNALS_THRESHOLD = 7
 
-def find_latest_mc_signal_before_cd(data, cd_date, mc_signals):
+# Holding periods evaluated after each signal (0 to 100) and the column/result keys derived from them
+PERIODS = tuple(range(0, 101))
+PERIODS_ARR = np.asarray(PERIODS, dtype=np.int64)
+RETURN_COLS = tuple(f'return_{period}' for period in PERIODS)
+VOLUME_COLS = tuple(f'volume_{period}' for period in PERIODS)
+TEST_COUNT_KEYS = tuple(f'test_count_{period}' for period in PERIODS)
+SUCCESS_RATE_KEYS = tuple(f'success_rate_{period}' for period in PERIODS)
+AVG_RETURN_KEYS = tuple(f'avg_return_{period}' for period in PERIODS)
+AVG_VOLUME_KEYS = tuple(f'avg_volume_{period}' for period in PERIODS)
+RETURNS_KEYS = tuple(f'returns_{period}' for period in PERIODS)
+VOLUMES_KEYS = tuple(f'volumes_{period}' for period in PERIODS)
+
+# Result fields used when there are no signal returns to evaluate (zeroed metrics, no MC data)
+_EMPTY_METRICS = {
+    'current_period': 0,
+    'max_return': 0,
+    'min_return': 0,
+    'price_history': {},
+    'volume_history': {},
+    **{key: value
+       for i in range(len(PERIODS))
+       for key, value in ((TEST_COUNT_KEYS[i], 0), (SUCCESS_RATE_KEYS[i], 0),
+                          (AVG_RETURN_KEYS[i], 0), (RETURNS_KEYS[i], []), (VOLUMES_KEYS[i], []))},
+    'mc_signals_before_cd': 0,
+    'mc_at_top_price_count': 0,
+    'mc_at_top_price_rate': 0,
+    'avg_mc_price_percentile': 0,
+    'avg_mc_decline_after': 0,
+    'avg_mc_criteria_met': 0,
+    'latest_mc_date': None,
+    'latest_mc_price': None,
+    'latest_mc_at_top_price': False,
+    'latest_mc_price_percentile': 0,
+    'latest_mc_decline_after': 0,
+    'latest_mc_criteria_met': 0
+}
+
+def _empty_result(base_fields):
     """
-    Find the latest MC signal that occurred before a given CD signal date.
+    Build a result with zeroed metrics on top of the given basic fields.
     
     Args:
-        data: DataFrame with price data
-        cd_date: Date of the CD signal
+        base_fields: Dictionary with ticker, interval, signal and current price fields
+    
+    Returns:
+        Result dictionary with fresh (unshared) list/dict values
+    """
+    result = dict(base_fields)
+    for key, value in _EMPTY_METRICS.items():
+        result[key] = type(value)() if isinstance(value, (list, dict)) else value
+    return result
+
+def find_latest_mc_signals_before_cd(cd_idx, mc_signals):
+    """
+    Find the latest MC signal that occurred before each given CD signal.
+    
+    Args:
+        cd_idx: Integer positions of the CD signals in data (ascending)
         mc_signals: Series with MC signals (boolean)
     
     Returns:
-        Tuple of (mc_signal_date, mc_signal_price) or (None, None) if no MC signal found
+        Array with the position of the latest earlier MC signal for each CD signal (-1 if none)
     """
-    # Get all MC signal dates before the CD signal date
+    # Get all MC signal positions once, then binary-search the predecessor of every CD signal
     # Handle NaN values by replacing them with False for boolean indexing
     mc_signals_bool = mc_signals.fillna(False).infer_objects(copy=False)
-    mc_signal_dates = data.index[mc_signals_bool]
-    previous_mc_signals = mc_signal_dates[mc_signal_dates < cd_date]
-    
-    if len(previous_mc_signals) == 0:
-        return None, None
+    mc_idx = np.flatnonzero(mc_signals_bool.to_numpy(dtype=bool))
     
-    # Get the latest MC signal before the CD signal
-    latest_mc_date = previous_mc_signals.max()
-    latest_mc_price = data.loc[latest_mc_date, 'Close']
+    if len(mc_idx) == 0:
+        return np.full(len(cd_idx), -1, dtype=np.int64)
     
-    return latest_mc_date, latest_mc_price
+    prev = np.searchsorted(mc_idx, cd_idx, side='left') - 1
+    return np.where(prev >= 0, mc_idx[np.maximum(prev, 0)], -1)
 
 def evaluate_mc_at_top_price(data, mc_date, mc_price, cd_date):
     """
@@ -51,80 +97,19 @@ def evaluate_mc_at_top_price(data, mc_date, mc_price, cd_date):
         Dictionary with evaluation metrics
     """
     try:
-        mc_idx = data.index.get_loc(mc_date)
-        cd_idx = data.index.get_loc(cd_date)
-        
-        # 1. Calculate lookback range: from EMA warmup period to latest CD time point
-        # Exclude unreliable early periods before EMA convergence
-        warmup_start = min(EMA_WARMUP_PERIOD, len(data) - 1)
-        lookback_data = data.iloc[warmup_start:cd_idx+1]  # Start from warmup period, include CD signal date
-        
-        # 2. Calculate lookahead range: from MC signal to latest CD time point
-        lookahead_data = data.iloc[mc_idx:cd_idx+1]  # Include CD signal date
-        
-        # Calculate metrics
-        metrics = {}
-        
-        # 1. Check if MC price is near the highest price in the full historical range
-        if not lookback_data.empty:
-            lookback_max = lookback_data['High'].max()
-            lookback_min = lookback_data['Low'].min()
-            lookback_range = lookback_max - lookback_min
-            
-            # Calculate percentile position of MC price in full historical range
-            if lookback_range > 0:
-                price_percentile = (mc_price - lookback_min) / lookback_range
-                metrics['lookback_price_percentile'] = price_percentile
-                metrics['is_near_lookback_high'] = price_percentile >= 0.8  # Top 20% of full range
-            else:
-                metrics['lookback_price_percentile'] = 0.5
-                metrics['is_near_lookback_high'] = False
-        else:
-            metrics['lookback_price_percentile'] = 0.5
-            metrics['is_near_lookback_high'] = False
-        
-        # 2. Check if price declined after MC signal until CD signal (more stringent threshold)
-        if len(lookahead_data) > 1:
-            lookahead_min = lookahead_data['Low'].min()
-            price_decline_pct = round((mc_price - lookahead_min) / mc_price * 100, 2)
-            metrics['price_decline_after_mc'] = price_decline_pct
-            metrics['is_followed_by_decline'] = price_decline_pct >= 5.0  # At least 5% decline (increased from 2%)
-        else:
-            metrics['price_decline_after_mc'] = 0
-            metrics['is_followed_by_decline'] = False
-        
-        # 3. Check if MC signal is at local maximum using relative method
-        # Use dynamic window size based on data availability and relative price position
-        # Calculate window size as a percentage of total data length (more robust across timeframes)
-        total_length = len(data)
-        window_size = max(3, min(10, total_length // 20))  # 5% of data length, but between 3-10 periods
-        
-        window_start = max(0, mc_idx - window_size)
-        window_end = min(len(data), mc_idx + window_size + 1)
-        window_data = data.iloc[window_start:window_end]
-        
-        if not window_data.empty and len(window_data) > 1:
-            # Use relative ranking instead of fixed percentage
-            window_highs = window_data['High'].values
-            mc_rank = sum(mc_price >= h for h in window_highs) / len(window_highs)
-            
-            # MC signal is local max if it's in top 30% of surrounding prices
-            is_local_max = mc_rank >= 0.7
-            metrics['is_local_maximum'] = is_local_max
-        else:
-            metrics['is_local_maximum'] = False
-        
-        # 4. Overall evaluation - MC signal is at "top price" if it meets multiple criteria
-        criteria_met = sum([
-            metrics['is_near_lookback_high'],
-            metrics['is_followed_by_decline'],
-            metrics['is_local_maximum']
-        ])
-        
-        metrics['criteria_met'] = criteria_met
-        metrics['is_at_top_price'] = criteria_met >= 2  # At least 2 out of 3 criteria
-        
-        return metrics
+        # Single-pair form of _mc_top_price_arrays, so both share one set of criteria
+        mc_idx = np.array([data.index.get_loc(mc_date)], dtype=np.int64)
+        cd_idx = np.array([data.index.get_loc(cd_date)], dtype=np.int64)
+        metrics = _mc_top_price_arrays(Bars.from_frame(data), mc_idx, cd_idx, mc_price=np.array([mc_price], dtype=np.float64))
+        return {
+            'lookback_price_percentile': float(metrics['lookback_price_percentile'][0]),  # Convert to Python float
+            'is_near_lookback_high': bool(metrics['is_near_lookback_high'][0]),
+            'price_decline_after_mc': float(metrics['price_decline_after_mc'][0]),  # Convert to Python float
+            'is_followed_by_decline': bool(metrics['is_followed_by_decline'][0]),
+            'is_local_maximum': bool(metrics['is_local_maximum'][0]),
+            'criteria_met': int(metrics['criteria_met'][0]),
+            'is_at_top_price': bool(metrics['is_at_top_price'][0])
+        }
         
     except Exception as e:
         print(f"Error evaluating MC signal at {mc_date}: {e}")
@@ -138,7 +123,160 @@ def evaluate_mc_at_top_price(data, mc_date, mc_price, cd_date):
             'is_at_top_price': False
         }
 
-def calculate_returns(data, cd_signals, periods=None, max_signals=MAX_SIGNALS_THRESHOLD):
+def _mc_top_price_arrays(bars, mc_idx, cd_idx, mc_price=None):
+    """
+    Compute the evaluate_mc_at_top_price metrics for many (MC signal, later CD signal) pairs, one array per metric.
+    
+    Args:
+        bars: Bars (column arrays) of the price data
+        mc_idx: Integer positions of the MC signals (int64 array, non-empty)
+        cd_idx: Integer positions of the matching CD signals (int64 array)
+        mc_price: Optional MC signal prices (default: the Close at each MC signal)
+    
+    Returns:
+        Dictionary mapping each metric name to an array with one value per pair
+    """
+    high, low = bars.high, bars.low
+    if mc_price is None:
+        mc_price = bars.close[mc_idx]
+    total_length = len(bars)
+    
+    warmup_start = min(EMA_WARMUP_PERIOD, total_length - 1)
+    window_size = max(3, min(10, total_length // 20))  # 5% of data length, but between 3-10 periods
+    
+    # Full-history range from the warmup period up to each CD signal, via running max/min
+    # (fmax/fmin skip NaN like the original pandas max/min reductions)
+    lookback_max = np.fmax.accumulate(high[warmup_start:])[cd_idx - warmup_start]
+    lookback_min = np.fmin.accumulate(low[warmup_start:])[cd_idx - warmup_start]
+    
+    # Lowest price from each MC signal to its CD signal; reduceat over interleaved [mc, cd+1) bounds,
+    # reading only the even slots (a sentinel keeps cd+1 in range for the last bar)
+    bounds = np.column_stack([mc_idx, cd_idx + 1]).ravel()
+    lookahead_min = np.fmin.reduceat(np.append(low, np.nan), bounds)[::2]
+    
+    # Highs of the window surrounding each MC signal, clipped to the data
+    window_idx = mc_idx[:, None] + np.arange(-window_size, window_size + 1)[None, :]
+    in_window = (window_idx >= 0) & (window_idx < total_length)
+    window_highs = high[np.clip(window_idx, 0, total_length - 1)]
+    window_len = in_window.sum(axis=1)
+    rank_count = (in_window & (mc_price[:, None] >= window_highs)).sum(axis=1)
+    
+    # 1. Check if MC price is near the highest price in the full historical range
+    lookback_range = lookback_max - lookback_min
+    with np.errstate(divide='ignore', invalid='ignore'):
+        price_percentile = np.where(lookback_range > 0, (mc_price - lookback_min) / lookback_range, 0.5)
+    is_near_lookback_high = (lookback_range > 0) & (price_percentile >= 0.8)  # Top 20% of full range
+    
+    # 2. Check if price declined after MC signal until CD signal
+    has_lookahead = cd_idx > mc_idx
+    price_decline = np.where(has_lookahead, np.round((mc_price - lookahead_min) / mc_price * 100, 2), 0)
+    is_followed_by_decline = has_lookahead & (price_decline >= 5.0)  # At least 5% decline
+    
+    # 3. Rank of each MC price among the highs of its surrounding window
+    mc_rank = rank_count / window_len
+    is_local_maximum = (window_len > 1) & (mc_rank >= 0.7)  # Top 30% of surrounding prices
+    
+    # 4. Overall evaluation - at least 2 out of 3 criteria
+    criteria_met = is_near_lookback_high.astype(np.int64) + is_followed_by_decline + is_local_maximum
+    
+    return {
+        'lookback_price_percentile': price_percentile,
+        'is_near_lookback_high': is_near_lookback_high,
+        'price_decline_after_mc': price_decline,
+        'is_followed_by_decline': is_followed_by_decline,
+        'is_local_maximum': is_local_maximum,
+        'criteria_met': criteria_met,
+        'is_at_top_price': criteria_met >= 2
+    }
+
+def _signal_return_matrices(data, signal_idx, periods_arr, max_signals, bars):
+    """
+    Gather returns and volumes for the latest CD signals as (signal, period) matrices.
+    
+    Args:
+        data: DataFrame with price data
+        signal_idx: Integer positions of the CD signals in data
+        periods_arr: Array of periods to calculate returns for
+        max_signals: Maximum number of latest signals to process
+        bars: Bars (column arrays) of data
+    
+    Returns:
+        Tuple of (signal positions used, returns matrix, volumes matrix)
+    """
+    # Limit to the latest N signals to reduce noise from older signals
+    if len(signal_idx) > max_signals:
+        signal_idx = signal_idx[-max_signals:]
+
+    # Skip signals that are too close to the end of the data
+    signal_idx = signal_idx[signal_idx + periods_arr.max() < len(data)]
+    if len(signal_idx) == 0:
+        # Every signal is too recent for the longest period; skip building the matrices
+        return signal_idx, np.empty((0, len(periods_arr))), np.empty((0, len(periods_arr)))
+
+    # Gather entry/exit prices for every (signal, period) pair in one shot
+    close = bars.close
+    entry_price = close[signal_idx][:, None]
+    returns_matrix = np.round((gather_periods(close, signal_idx, periods_arr) - entry_price) / entry_price * 100, 2)
+    # Volumes stay float so missing (NaN) bars can be masked out; only the stored values are cast to int
+    volumes_matrix = gather_periods(bars.volume, signal_idx, periods_arr).astype(np.float64)
+    return signal_idx, returns_matrix, volumes_matrix
+
+def _mc_analysis(data, signal_idx, bars=None, mc_signals=None):
+    """
+    Evaluate the latest MC signal before each CD signal.
+    
+    Args:
+        data: DataFrame with price data
+        signal_idx: Integer positions of the CD signals to analyze
+        bars: Optional precomputed Bars (column arrays) of data
+        mc_signals: Optional precomputed Series with MC signals (computed when not given)
+    
+    Returns:
+        Dictionary of MC signal analysis columns, one value per CD signal
+    """
+    if bars is None:
+        bars = Bars.from_frame(data)
+    if mc_signals is None:
+        # Also compute MC signals for analysis
+        mc_signals = cached_mc_indicator(data)
+    # Find the latest MC signal before every CD signal
+    latest_mc_idx = find_latest_mc_signals_before_cd(signal_idx, mc_signals)
+    has_mc = latest_mc_idx >= 0
+    
+    # Columns default to the "no MC signal" values and are filled in for the CD signals that have one
+    signal_count = len(signal_idx)
+    prev_mc_date = np.full(signal_count, None, dtype=object)
+    prev_mc_price = np.full(signal_count, None, dtype=object)
+    mc_at_top_price = np.zeros(signal_count, dtype=bool)
+    mc_price_percentile = np.zeros(signal_count)
+    mc_decline_after = np.zeros(signal_count)
+    mc_criteria_met = np.zeros(signal_count, dtype=np.int64)
+    
+    if has_mc.any():
+        mc_idx = latest_mc_idx[has_mc]
+        # Evaluate if the MC signals were at top price, all pairs in one vectorized pass
+        metrics = _mc_top_price_arrays(bars, mc_idx, np.asarray(signal_idx, dtype=np.int64)[has_mc])
+        mc_price = bars.close[mc_idx]
+        prev_mc_date[has_mc] = data.index[mc_idx].strftime('%Y-%m-%d %H:%M:%S')
+        # Prices become a float column (NaN where missing) once any CD signal has an MC signal
+        prev_mc_price = np.full(signal_count, np.nan)
+        prev_mc_price[has_mc] = np.where(mc_price != 0, np.round(mc_price, 2), np.nan)
+        mc_at_top_price[has_mc] = metrics['is_at_top_price']
+        mc_price_percentile[has_mc] = np.round(metrics['lookback_price_percentile'], 2)
+        mc_decline_after[has_mc] = np.round(metrics['price_decline_after_mc'], 2)
+        mc_criteria_met[has_mc] = metrics['criteria_met']
+    
+    return {
+        'prev_mc_date': prev_mc_date,
+        'prev_mc_price': prev_mc_price,
+        'mc_at_top_price': mc_at_top_price,
+        'mc_price_percentile': mc_price_percentile,
+        'mc_decline_after': mc_decline_after,
+        'mc_criteria_met': mc_criteria_met
+    }
+
+def calculate_returns(data, cd_signals, periods=None, max_signals=MAX_SIGNALS_THRESHOLD, signal_idx=None, bars=None,
+                      mc_signals=None):
     """
     Calculate returns after CD signals for specified periods.
     
@@ -147,82 +285,50 @@ def calculate_returns(data, cd_signals, periods=None, max_signals=MAX_SIGNALS_TH
         cd_signals: Series with CD signals (boolean)
         periods: List of periods to calculate returns for (default: 0 to 100)
         max_signals: Maximum number of latest signals to process (default: MAX_SIGNALS_THRESHOLD)
+        signal_idx: Optional precomputed integer positions of the CD signals in data
+        bars: Optional precomputed Bars (column arrays) of data
+        mc_signals: Optional precomputed Series with MC signals for the MC analysis columns
     
     Returns:
         DataFrame with signal dates, returns, and volume data for each period
     """
     if periods is None:
-        periods = [0] + list(range(1, 101))  # Full range from 0 to 100
-    results = []
-    # Handle NaN values by replacing them with False for boolean indexing
-    cd_signals_bool = cd_signals.fillna(False).infer_objects(copy=False)
-    signal_dates = data.index[cd_signals_bool]
-    
-    # Limit to the latest N signals to reduce noise from older signals
-    if len(signal_dates) > max_signals:
-        signal_dates = signal_dates[-max_signals:]
-    
-    # Also compute MC signals for analysis
-    mc_signals = compute_mc_indicator(data)
-    
-    for date in signal_dates:
-        idx = data.index.get_loc(date)
-        
-        # Skip signals that are too close to the end of the data
-        if idx + max(periods) >= len(data):
-            continue
-            
-        entry_price = data.loc[date, 'Close']
-        entry_volume = data.loc[date, 'Volume']
-        returns = {}
-        volumes = {}
-        
-        for period in periods:
-            if idx + period < len(data):
-                exit_price = data.iloc[idx + period]['Close']
-                exit_volume = data.iloc[idx + period]['Volume']
-                returns[f'return_{period}'] = round(float((exit_price - entry_price) / entry_price * 100), 2)  # Convert to Python float
-                volumes[f'volume_{period}'] = round(int(exit_volume), 0)  # Convert to Python int
-            else:
-                returns[f'return_{period}'] = np.nan
-                volumes[f'volume_{period}'] = np.nan
-        
-        # Find the latest MC signal before this CD signal
-        latest_mc_date, latest_mc_price = find_latest_mc_signal_before_cd(data, date, mc_signals)
-        
-        # Evaluate if the MC signal was at top price
-        mc_evaluation = {}
-        if latest_mc_date is not None:
-            mc_evaluation = evaluate_mc_at_top_price(data, latest_mc_date, latest_mc_price, date)
-            
-        # Add MC signal analysis to the results
-        mc_info = {
-            'prev_mc_date': latest_mc_date.strftime('%Y-%m-%d %H:%M:%S') if latest_mc_date else None,
-            'prev_mc_price': round(latest_mc_price, 2) if latest_mc_price else None,
-            'mc_at_top_price': mc_evaluation.get('is_at_top_price', False),
-            'mc_price_percentile': round(mc_evaluation.get('lookback_price_percentile', 0), 2),
-            'mc_decline_after': round(mc_evaluation.get('price_decline_after_mc', 0), 2),
-            'mc_criteria_met': mc_evaluation.get('criteria_met', 0)
-        }
-                
-        results.append({
-            'date': date,
-            'entry_volume': entry_volume,
-            **returns,
-            **volumes,
-            **mc_info
-        })
-    
-    return pd.DataFrame(results)
+        periods_arr, return_cols, volume_cols = PERIODS_ARR, RETURN_COLS, VOLUME_COLS
+    else:
+        periods_arr = np.asarray(periods, dtype=np.int64)
+        return_cols = [f'return_{period}' for period in periods]
+        volume_cols = [f'volume_{period}' for period in periods]
+    if signal_idx is None:
+        # Handle NaN values by replacing them with False for boolean indexing
+        cd_signals_bool = cd_signals.fillna(False).infer_objects(copy=False)
+        signal_idx = np.flatnonzero(cd_signals_bool.to_numpy(dtype=bool))
+    if bars is None:
+        bars = Bars.from_frame(data)
+
+    signal_idx, returns_matrix, volumes_matrix = _signal_return_matrices(data, signal_idx, periods_arr, max_signals, bars)
+    if len(signal_idx) == 0:
+        return pd.DataFrame()
+    signal_dates = data.index[signal_idx]
+    if np.isfinite(volumes_matrix).all():
+        volumes_matrix = volumes_matrix.astype(np.int64)  # Integer volume columns unless a bar has no volume
 
-def evaluate_interval(ticker, interval, data=None):
+    return pd.DataFrame({
+        'date': signal_dates,
+        'entry_volume': bars.volume[signal_idx],
+        **{col: returns_matrix[:, i] for i, col in enumerate(return_cols)},
+        **{col: volumes_matrix[:, i] for i, col in enumerate(volume_cols)},
+        **_mc_analysis(data, signal_idx, bars, mc_signals)
+    })
+
+def evaluate_interval(ticker, interval, data=None, cd_signals=None):
     """
     Evaluate CD signals for a specific ticker and interval.
     
     Args:
         ticker: Stock ticker symbol
         interval: Time interval to evaluate
-        data: Optional pre-downloaded data dictionary
+        data: Optional pre-downloaded data dictionary (intervals missing from it are downloaded)
+        cd_signals: Optional precomputed Series with CD signals for the interval's data frame
     
     Returns:
         Dictionary with evaluation metrics and individual returns
@@ -240,89 +346,57 @@ def evaluate_interval(ticker, interval, data=None):
                 if data and '1d' in data and not data['1d'].empty:
                     daily_data = data['1d']
                 else:
-                    stock = yf.Ticker(ticker)
-                    daily_data = stock.history(interval='1d', period='1y')
+                    daily_data = get_daily_history(ticker)
                     
                 if daily_data.empty:
                     return None
                     
                 # Resample daily data to weekly
-                data_frame = daily_data.resample('W').agg({
-                    'Open': 'first',
-                    'High': 'max',
-                    'Low': 'min',
-                    'Close': 'last',
-                    'Volume': 'sum'
-                })
+                data_frame = resample_weekly(daily_data, ticker)
             # Get data based on interval type
             elif interval in ['5m', '10m', '15m', '30m', '1h', '2h', '3h', '4h']:
                 data_ticker = download_stock_data(ticker, end_date=None)
                 data_frame = data_ticker[interval]
             elif interval == '1d':
-                stock = yf.Ticker(ticker)
-                data_frame = stock.history(interval='1d', period='1y')
+                data_frame = get_daily_history(ticker)
             else:
                 return None
                 
         if data_frame.empty:
             return None
-            
-        # Compute CD signals
-        cd_signals = compute_cd_indicator(data_frame)
-        # Handle NaN values for signal count calculation
-        signal_count = cd_signals.fillna(False).infer_objects(copy=False).sum()
         
-        # Get the latest signal date
+        # Column arrays shared by all positional lookups below
+        bars = Bars.from_frame(data_frame)
+            
+        # Compute CD signals (unless the caller already has them)
+        if cd_signals is None:
+            cd_signals = cached_cd_indicator(data_frame)
+        # Signal positions give both the signal count and the latest signal in one pass
         # Handle NaN values by replacing them with False for boolean indexing
         cd_signals_bool = cd_signals.fillna(False).infer_objects(copy=False)
-        latest_signal_date = data_frame.index[cd_signals_bool].max() if signal_count > 0 else None
+        signal_idx = np.flatnonzero(cd_signals_bool.to_numpy(dtype=bool))
+        signal_count = int(signal_idx.size)
+        
+        # Get the latest signal date
+        latest_signal_date = data_frame.index[signal_idx[-1]] if signal_count > 0 else None
         latest_signal_str = latest_signal_date.strftime('%Y-%m-%d %H:%M:%S') if latest_signal_date else None
-        latest_signal_price = round(float(data_frame.loc[latest_signal_date, 'Close']), 2) if latest_signal_date is not None else None  # Convert to Python float
+        latest_signal_price = round(float(bars.close[signal_idx[-1]]), 2) if latest_signal_date is not None else None  # Convert to Python float
         
         # Get current time and price
         current_time = data_frame.index[-1]
         current_time_str = current_time.strftime('%Y-%m-%d %H:%M:%S')
-        current_price = round(float(data_frame.iloc[-1]['Close']), 2)  # Convert to Python float
+        current_price = round(float(bars.close[-1]), 2)  # Convert to Python float
         
         if signal_count == 0:
-            result = {
+            result = _empty_result({
                 'ticker': ticker,
                 'interval': interval,
                 'signal_count': 0,
                 'latest_signal': None,
                 'latest_signal_price': None,
                 'current_time': current_time_str,
-                'current_price': current_price,
-                'current_period': 0,
-                'max_return': 0,
-                'min_return': 0,
-                'price_history': {},
-                'volume_history': {}
-            }
-            # Add zero values for all periods
-            periods = [0] + list(range(1, 101))  # Full range from 0 to 100
-            for period in periods:
-                result[f'test_count_{period}'] = 0
-                result[f'success_rate_{period}'] = 0
-                result[f'avg_return_{period}'] = 0
-                result[f'returns_{period}'] = []  # Store empty list for individual returns
-                result[f'volumes_{period}'] = [] # Store empty list for individual volumes
-            
-            # Add MC signal analysis fields
-            result['mc_signals_before_cd'] = 0
-            result['mc_at_top_price_count'] = 0
-            result['mc_at_top_price_rate'] = 0
-            result['avg_mc_price_percentile'] = 0
-            result['avg_mc_decline_after'] = 0
-            result['avg_mc_criteria_met'] = 0
-            
-            # Add latest MC signal data (all None/False when no data)
-            result['latest_mc_date'] = None
-            result['latest_mc_price'] = None
-            result['latest_mc_at_top_price'] = False
-            result['latest_mc_price_percentile'] = 0
-            result['latest_mc_decline_after'] = 0
-            result['latest_mc_criteria_met'] = 0
+                'current_price': current_price
+            })
             
             # Add NX values (both signal and current values)
             result['nx_1d_signal'] = None
@@ -350,51 +424,20 @@ def evaluate_interval(ticker, interval, data=None):
             return result
             
         # Calculate returns for each signal (limit to latest signals to reduce noise)
-        returns_df = calculate_returns(data_frame, cd_signals, max_signals=MAX_SIGNALS_THRESHOLD)
+        # The (signal, period) matrices are used directly instead of going through a returns DataFrame
+        returns_idx, returns_matrix, volumes_matrix = _signal_return_matrices(
+            data_frame, signal_idx, PERIODS_ARR, MAX_SIGNALS_THRESHOLD, bars)
         
-        if returns_df.empty:
-            result = {
+        if len(returns_idx) == 0:
+            return _empty_result({
                 'ticker': ticker,
                 'interval': interval,
                 'signal_count': signal_count,
                 'latest_signal': latest_signal_str,
                 'latest_signal_price': latest_signal_price,
                 'current_time': current_time_str,
-                'current_price': current_price,
-                'current_period': 0,
-                'max_return': 0,
-                'min_return': 0,
-                'price_history': {},
-                'volume_history': {}
-            }
-            # Add zero values for all periods
-            periods = [0] + list(range(1, 101))  # Full range from 0 to 100
-            for period in periods:
-                result[f'test_count_{period}'] = 0
-                result[f'success_rate_{period}'] = 0
-                result[f'avg_return_{period}'] = 0
-                result[f'returns_{period}'] = []  # Store empty list for individual returns
-                result[f'volumes_{period}'] = [] # Store empty list for individual volumes
-            
-            # Add MC signal analysis fields
-            result['mc_signals_before_cd'] = 0
-            result['mc_at_top_price_count'] = 0
-            result['mc_at_top_price_rate'] = 0
-            result['avg_mc_price_percentile'] = 0
-            result['avg_mc_decline_after'] = 0
-            result['avg_mc_criteria_met'] = 0
-            
-            # Add latest MC signal data (all None/False when no data)
-            result['latest_mc_date'] = None
-            result['latest_mc_price'] = None
-            result['latest_mc_at_top_price'] = False
-            result['latest_mc_price_percentile'] = 0
-            result['latest_mc_decline_after'] = 0
-            result['latest_mc_criteria_met'] = 0
-            return result
-        
-        # Define all periods
-        periods = [0] + list(range(1, 101))  # Full range from 0 to 100
+                'current_price': current_price
+            })
         
         # Initialize result dictionary with basic info
         result = {
@@ -410,33 +453,27 @@ def evaluate_interval(ticker, interval, data=None):
         # Calculate current period if there's a latest signal
         if latest_signal_date:
             # Find the index of the latest signal and current time
-            signal_idx = data_frame.index.get_loc(latest_signal_date)
-            current_idx = len(data_frame) - 1
+            latest_signal_idx = signal_idx[-1]
+            current_idx = len(bars) - 1
             # Calculate current period as the number of data points between signal and current time
-            current_period = current_idx - signal_idx
+            current_period = int(current_idx - latest_signal_idx)
             
             # Calculate actual price history and volume history for the latest signal
-            price_history = {}
-            volume_history = {}
-            entry_price = data_frame.loc[latest_signal_date, 'Close']
-            entry_volume = data_frame.loc[latest_signal_date, 'Volume']
-            price_history[0] = round(float(entry_price), 2)  # Entry price at period 0, convert to Python float
-            volume_history[0] = round(int(entry_volume), 0)  # Entry volume at period 0, convert to Python int
-            
-            for period in periods:
-                if signal_idx + period < len(data_frame):
-                    actual_price = data_frame.iloc[signal_idx + period]['Close']
-                    actual_volume = data_frame.iloc[signal_idx + period]['Volume']
-                    price_history[period] = round(float(actual_price), 2)  # Convert to Python float
-                    volume_history[period] = round(int(actual_volume), 0)  # Convert to Python int
-                else:
-                    price_history[period] = None
-                    volume_history[period] = None
+            # (period 0 is the entry bar; periods past the end of the data are None)
+            available_periods = len(bars) - latest_signal_idx
+            price_history = {
+                period: round(float(bars.close[latest_signal_idx + period]), 2) if period < available_periods else None  # Convert to Python float
+                for period in PERIODS
+            }
+            volume_history = {
+                period: int(bars.volume[latest_signal_idx + period]) if period < available_periods else None  # Convert to Python int
+                for period in PERIODS
+            }
                     
             # Add current price and volume if we're beyond the latest period
-            if current_period > max(periods):
+            if current_period > PERIODS[-1]:
                 price_history[current_period] = round(float(current_price), 2)  # Convert to Python float
-                volume_history[current_period] = round(int(data_frame.iloc[-1]['Volume']), 0)  # Convert to Python int
+                volume_history[current_period] = int(bars.volume[-1])  # Convert to Python int
         else:
             current_period = 0
             price_history = {}
@@ -446,55 +483,65 @@ def evaluate_interval(ticker, interval, data=None):
         result['price_history'] = price_history
         result['volume_history'] = volume_history
         
-        # Calculate metrics for each period dynamically
-        for period in periods:
-            return_col = f'return_{period}'
-            volume_col = f'volume_{period}'
-            if return_col in returns_df:
-                # Get individual returns and volumes (excluding NaN values)
-                individual_returns = [round(float(x), 2) for x in returns_df[return_col].dropna().tolist()]  # Convert to Python float
-                individual_volumes = [round(int(x), 0) for x in returns_df[volume_col].dropna().tolist()] if volume_col in returns_df else []  # Convert to Python int
-                test_count = len(individual_returns)
-                success_rate = round(float((pd.Series(returns_df[return_col].dropna()) > 0).mean() * 100), 2)  # Convert to Python float
-                avg_return = round(float(pd.Series(returns_df[return_col].dropna()).mean()), 2) if test_count > 0 else 0  # Convert to Python float
-                avg_volume = round(int(pd.Series(returns_df[volume_col].dropna()).mean()), 0) if volume_col in returns_df and len(returns_df[volume_col].dropna()) > 0 else 0  # Convert to Python int
+        # Calculate metrics for all periods at once with column reductions over the returns matrix
+        valid = ~np.isnan(returns_matrix)
+        test_counts = valid.sum(axis=0)
+        success_counts = (returns_matrix > 0).sum(axis=0)
+        return_sums = np.where(valid, returns_matrix, 0).sum(axis=0)
+        volume_valid = np.isfinite(volumes_matrix)
+        volume_counts = volume_valid.sum(axis=0)
+        volume_sums = np.where(volume_valid, volumes_matrix, 0).sum(axis=0)
+        
+        # Per-period rates and averages in one vectorized pass, converted to Python floats once
+        with np.errstate(invalid='ignore', divide='ignore'):
+            success_rates = (success_counts / test_counts * 100).tolist()
+            avg_returns = (return_sums / test_counts).tolist()
+            avg_volumes = (volume_sums / volume_counts).tolist()
+        
+        for i in range(len(PERIODS)):
+            test_count = int(test_counts[i])
+            if test_count > 0:
+                success_rate = round(success_rates[i], 2)
+                avg_return = round(avg_returns[i], 2)
             else:
-                individual_returns = []
-                individual_volumes = []
-                test_count = 0
                 success_rate = 0
                 avg_return = 0
-                avg_volume = 0
+            avg_volume = int(avg_volumes[i]) if volume_counts[i] > 0 else 0  # Convert to Python int
             
-            result[f'test_count_{period}'] = test_count
-            result[f'success_rate_{period}'] = success_rate
-            result[f'avg_return_{period}'] = avg_return
-            result[f'avg_volume_{period}'] = avg_volume
-            result[f'returns_{period}'] = individual_returns  # Store individual returns for boxplot
-            result[f'volumes_{period}'] = individual_volumes  # Store individual volumes for volume chart
+            result[TEST_COUNT_KEYS[i]] = test_count
+            result[SUCCESS_RATE_KEYS[i]] = success_rate
+            result[AVG_RETURN_KEYS[i]] = avg_return
+            result[AVG_VOLUME_KEYS[i]] = avg_volume
+            # The returns matrix is already rounded to 2 decimals
+            result[RETURNS_KEYS[i]] = returns_matrix[valid[:, i], i].tolist()  # Store individual returns for boxplot
+            result[VOLUMES_KEYS[i]] = volumes_matrix[volume_valid[:, i], i].astype(np.int64).tolist()  # Store individual volumes for volume chart
         
         # Add MC signal analysis summary to the result
-        if not returns_df.empty:
+        mc_df = pd.DataFrame({'date': data_frame.index[returns_idx], **_mc_analysis(data_frame, returns_idx, bars)})
+        if not mc_df.empty:
             # Calculate MC signal statistics
-            mc_at_top_count = returns_df['mc_at_top_price'].sum() if 'mc_at_top_price' in returns_df else 0
-            mc_total_count = len(returns_df[returns_df['prev_mc_date'].notna()]) if 'prev_mc_date' in returns_df else 0
+            mc_at_top_count = int(np.count_nonzero(mc_df['mc_at_top_price'].to_numpy(dtype=bool)))
+            has_prev_mc = mc_df['prev_mc_date'].notna()
+            mc_total_count = int(np.count_nonzero(has_prev_mc.to_numpy()))
             mc_at_top_rate = round((mc_at_top_count / mc_total_count * 100), 2) if mc_total_count > 0 else 0
             
-            # Average MC evaluation metrics
-            avg_mc_percentile = round(float(returns_df['mc_price_percentile'].mean()), 2) if 'mc_price_percentile' in returns_df else 0  # Convert to Python float
-            avg_mc_decline = round(float(returns_df['mc_decline_after'].mean()), 2) if 'mc_decline_after' in returns_df else 0  # Convert to Python float
-            avg_mc_criteria = round(float(returns_df['mc_criteria_met'].mean()), 2) if 'mc_criteria_met' in returns_df else 0  # Convert to Python float
+            # Average MC evaluation metrics, all columns in one NaN-skipping pass over a single block
+            mc_stats = mc_df[['mc_price_percentile', 'mc_decline_after', 'mc_criteria_met']].to_numpy(dtype=np.float64)
+            stats_valid = ~np.isnan(mc_stats)
+            with np.errstate(invalid='ignore'):
+                stats_means = np.where(stats_valid, mc_stats, 0).sum(axis=0) / stats_valid.sum(axis=0)
+            avg_mc_percentile, avg_mc_decline, avg_mc_criteria = (round(float(mean), 2) for mean in stats_means)  # Convert to Python float
             
             # Latest MC signal data (from the most recent CD signal)
-            latest_cd_signal = returns_df[returns_df['prev_mc_date'].notna()].sort_values('date', ascending=False)
-            if not latest_cd_signal.empty:
-                latest_mc_data = latest_cd_signal.iloc[0]
-                latest_mc_price = latest_mc_data['prev_mc_price'] if 'prev_mc_price' in latest_mc_data else None
-                latest_mc_date = latest_mc_data['prev_mc_date'] if 'prev_mc_date' in latest_mc_data else None
-                latest_mc_at_top_price = latest_mc_data['mc_at_top_price'] if 'mc_at_top_price' in latest_mc_data else False
-                latest_mc_price_percentile = latest_mc_data['mc_price_percentile'] if 'mc_price_percentile' in latest_mc_data else 0
-                latest_mc_decline_after = latest_mc_data['mc_decline_after'] if 'mc_decline_after' in latest_mc_data else 0
-                latest_mc_criteria_met = latest_mc_data['mc_criteria_met'] if 'mc_criteria_met' in latest_mc_data else 0
+            if mc_total_count > 0:
+                # Row with the latest date among those with an MC signal (argmax instead of a full sort)
+                latest_mc_data = mc_df.loc[mc_df.loc[has_prev_mc, 'date'].idxmax()]
+                latest_mc_price = latest_mc_data['prev_mc_price']
+                latest_mc_date = latest_mc_data['prev_mc_date']
+                latest_mc_at_top_price = latest_mc_data['mc_at_top_price']
+                latest_mc_price_percentile = latest_mc_data['mc_price_percentile']
+                latest_mc_decline_after = latest_mc_data['mc_decline_after']
+                latest_mc_criteria_met = latest_mc_data['mc_criteria_met']
             else:
                 latest_mc_price = None
                 latest_mc_date = None
@@ -514,10 +561,10 @@ def evaluate_interval(ticker, interval, data=None):
             # Add latest MC signal data
             result['latest_mc_date'] = latest_mc_date
             result['latest_mc_price'] = round(float(latest_mc_price), 2) if latest_mc_price else None  # Convert to Python float
-            result['latest_mc_at_top_price'] = latest_mc_at_top_price
+            result['latest_mc_at_top_price'] = bool(latest_mc_at_top_price)  # Convert to Python bool
             result['latest_mc_price_percentile'] = round(float(latest_mc_price_percentile), 2)  # Convert to Python float
             result['latest_mc_decline_after'] = round(float(latest_mc_decline_after), 2)  # Convert to Python float
-            result['latest_mc_criteria_met'] = latest_mc_criteria_met
+            result['latest_mc_criteria_met'] = int(latest_mc_criteria_met)  # Convert to Python int
         else:
             result['mc_signals_before_cd'] = 0
             result['mc_at_top_price_count'] = 0
@@ -534,14 +581,10 @@ def evaluate_interval(ticker, interval, data=None):
             result['latest_mc_decline_after'] = 0
             result['latest_mc_criteria_met'] = 0
         
-        # Calculate max and min returns across all periods
-        all_returns = []
-        for col in returns_df.columns:
-            if col.startswith('return_'):
-                all_returns.extend(returns_df[col].dropna().tolist())
-                
-        result['max_return'] = round(float(max(all_returns)), 2) if all_returns else 0  # Convert to Python float
-        result['min_return'] = round(float(min(all_returns)), 2) if all_returns else 0  # Convert to Python float
+        # Calculate max and min returns across all periods with single reductions over the matrix
+        has_returns = bool(valid.any())
+        result['max_return'] = round(float(np.nanmax(returns_matrix)), 2) if has_returns else 0  # Convert to Python float
+        result['min_return'] = round(float(np.nanmin(returns_matrix)), 2) if has_returns else 0  # Convert to Python float
         
         # Add NX values (both signal and current values)
         # Signal NX values (at signal dates) - using the latest signal date if available
@@ -1,8 +1,7 @@
 import pandas as pd
 import numpy as np
-from data_loader import download_stock_data
-from indicators import compute_mc_indicator, compute_cd_indicator
-import yfinance as yf
+from data_loader import download_stock_data, get_daily_history, resample_weekly, Bars, gather_periods
+from indicators import cached_mc_indicator, cached_cd_indicator
 
 # EMA warmup period - should match the value in indicators.py
 EMA_WARMUP_PERIOD = 0
@@ -10,34 +9,83 @@ EMA_WARMUP_PERIOD = 0
 # Maximum number of latest signals to process (to reduce noise from older signals)
 MAX_SIGNALS_THRESHOLD = 7
 
-def find_latest_cd_signal_before_mc(data, mc_date, cd_signals):
+# Holding periods evaluated after each signal (0 to 100) and the column/result keys derived from them
+PERIODS = tuple(range(0, 101))
+PERIODS_ARR = np.asarray(PERIODS, dtype=np.int64)
+RETURN_COLS = tuple(f'return_{period}' for period in PERIODS)
+VOLUME_COLS = tuple(f'volume_{period}' for period in PERIODS)
+TEST_COUNT_KEYS = tuple(f'test_count_{period}' for period in PERIODS)
+SUCCESS_RATE_KEYS = tuple(f'success_rate_{period}' for period in PERIODS)
+AVG_RETURN_KEYS = tuple(f'avg_return_{period}' for period in PERIODS)
+AVG_VOLUME_KEYS = tuple(f'avg_volume_{period}' for period in PERIODS)
+RETURNS_KEYS = tuple(f'returns_{period}' for period in PERIODS)
+VOLUMES_KEYS = tuple(f'volumes_{period}' for period in PERIODS)
+
+# Result fields used when there are no signal returns to evaluate (zeroed metrics, no CD data)
+_EMPTY_METRICS = {
+    'current_period': 0,
+    'max_return': 0,
+    'min_return': 0,
+    'price_history': {},
+    'volume_history': {},
+    **{key: value
+       for i in range(len(PERIODS))
+       for key, value in ((TEST_COUNT_KEYS[i], 0), (SUCCESS_RATE_KEYS[i], 0),
+                          (AVG_RETURN_KEYS[i], 0), (AVG_VOLUME_KEYS[i], 0),
+                          (RETURNS_KEYS[i], []), (VOLUMES_KEYS[i], []))},
+    'cd_signals_before_mc': 0,
+    'cd_at_bottom_price_count': 0,
+    'cd_at_bottom_price_rate': 0,
+    'avg_cd_price_percentile': 0,
+    'avg_cd_increase_after': 0,
+    'avg_cd_criteria_met': 0,
+    'latest_cd_date': None,
+    'latest_cd_price': None,
+    'latest_cd_at_bottom_price': False,
+    'latest_cd_price_percentile': 0,
+    'latest_cd_increase_after': 0,
+    'latest_cd_criteria_met': 0
+}
+
+def _empty_result(base_fields):
     """
-    Find the latest CD signal that occurred before a given MC signal date.
+    Build a result with zeroed metrics on top of the given basic fields.
     
     Args:
-        data: DataFrame with price data
-        mc_date: Date of the MC signal
+        base_fields: Dictionary with ticker, interval, signal and current price fields
+    
+    Returns:
+        Result dictionary with fresh (unshared) list/dict values
+    """
+    result = dict(base_fields)
+    for key, value in _EMPTY_METRICS.items():
+        result[key] = type(value)() if isinstance(value, (list, dict)) else value
+    return result
+
+def find_latest_cd_signals_before_mc(mc_idx, cd_signals):
+    """
+    Find the latest CD signal that occurred before each given MC signal.
+    
+    Args:
+        mc_idx: Integer positions of the MC signals in data (ascending)
         cd_signals: Series with CD signals (boolean)
     
     Returns:
-        Tuple of (cd_signal_date, cd_signal_price) or (None, None) if no CD signal found
+        Array with the position of the latest earlier CD signal for each MC signal (-1 if none)
     """
-    # Get all CD signal dates before the MC signal date
+    # Get all CD signal positions once, then binary-search the predecessor of every MC signal
     # Handle NaN values by replacing them with False for boolean indexing
     cd_signals_bool = cd_signals.fillna(False).infer_objects(copy=False)
-    cd_signal_dates = data.index[cd_signals_bool]
-    previous_cd_signals = cd_signal_dates[cd_signal_dates < mc_date]
-    
-    if len(previous_cd_signals) == 0:
-        return None, None
+    cd_idx = np.flatnonzero(cd_signals_bool.to_numpy(dtype=bool))
     
-    # Get the latest CD signal before the MC signal
-    latest_cd_date = previous_cd_signals.max()
-    latest_cd_price = data.loc[latest_cd_date, 'Close']
+    if len(cd_idx) == 0:
+        return np.full(len(mc_idx), -1, dtype=np.int64)
     
-    return latest_cd_date, latest_cd_price
+    prev = np.searchsorted(cd_idx, mc_idx, side='left') - 1
+    return np.where(prev >= 0, cd_idx[np.maximum(prev, 0)], -1)
 
-def evaluate_cd_at_bottom_price(data, cd_date, cd_price, mc_date):
+def evaluate_cd_at_bottom_price(data, cd_date, cd_price, mc_date, cd_idx=None, mc_idx=None, high=None, low=None,
+                                running_high=None, running_low=None):
     """
     Evaluate if a CD signal was at a "bottom price" by checking if it was near a local minimum.
     
@@ -46,29 +94,48 @@ def evaluate_cd_at_bottom_price(data, cd_date, cd_price, mc_date):
         cd_date: Date of the CD signal
         cd_price: Price at the CD signal
         mc_date: Date of the latest MC signal (used for range calculations)
+        cd_idx: Optional precomputed integer position of cd_date in data
+        mc_idx: Optional precomputed integer position of mc_date in data
+        high: Optional precomputed High column as a NumPy array
+        low: Optional precomputed Low column as a NumPy array
+        running_high: Optional running max of High from the EMA warmup period onwards
+        running_low: Optional running min of Low from the EMA warmup period onwards
     
     Returns:
         Dictionary with evaluation metrics
     """
     try:
-        cd_idx = data.index.get_loc(cd_date)
-        mc_idx = data.index.get_loc(mc_date)
+        if cd_idx is None:
+            cd_idx = data.index.get_loc(cd_date)
+        if mc_idx is None:
+            mc_idx = data.index.get_loc(mc_date)
+        
+        if high is None:
+            high = data['High'].to_numpy(dtype=np.float64)
+        if low is None:
+            low = data['Low'].to_numpy(dtype=np.float64)
         
         # 1. Calculate lookback range: from EMA warmup period to latest MC time point
         # Exclude unreliable early periods before EMA convergence
         warmup_start = min(EMA_WARMUP_PERIOD, len(data) - 1)
-        lookback_data = data.iloc[warmup_start:mc_idx+1]  # Start from warmup period, include MC signal date
+        lookback_high = high[warmup_start:mc_idx+1]
+        lookback_low = low[warmup_start:mc_idx+1]  # Start from warmup period, include MC signal date
         
         # 2. Calculate lookahead range: from CD signal to latest MC time point
-        lookahead_data = data.iloc[cd_idx:mc_idx+1]  # Include MC signal date
+        lookahead_high = high[cd_idx:mc_idx+1]  # Include MC signal date
         
         # Calculate metrics
         metrics = {}
         
         # 1. Check if CD price is near the lowest price in the full historical range
-        if not lookback_data.empty:
-            lookback_max = lookback_data['High'].max()
-            lookback_min = lookback_data['Low'].min()
+        if lookback_high.size > 0:
+            if running_high is not None and running_low is not None:
+                # O(1) lookup of the range extremes up to the MC signal
+                lookback_max = running_high[mc_idx - warmup_start]
+                lookback_min = running_low[mc_idx - warmup_start]
+            else:
+                lookback_max = np.fmax.reduce(lookback_high)
+                lookback_min = np.fmin.reduce(lookback_low)
             lookback_range = lookback_max - lookback_min
             
             # Calculate percentile position of CD price in full historical range (inverse for bottom)
@@ -84,8 +151,8 @@ def evaluate_cd_at_bottom_price(data, cd_date, cd_price, mc_date):
             metrics['is_near_lookback_low'] = False
         
         # 2. Check if price increased after CD signal until MC signal
-        if len(lookahead_data) > 1:
-            lookahead_max = lookahead_data['High'].max()
+        if lookahead_high.size > 1:
+            lookahead_max = np.fmax.reduce(lookahead_high)
             price_increase_pct = round(float((lookahead_max - cd_price) / cd_price * 100), 2)
             metrics['price_increase_after_cd'] = price_increase_pct
             metrics['is_followed_by_increase'] = price_increase_pct >= 5.0  # At least 5% increase
@@ -100,12 +167,11 @@ def evaluate_cd_at_bottom_price(data, cd_date, cd_price, mc_date):
         
         window_start = max(0, cd_idx - window_size)
         window_end = min(len(data), cd_idx + window_size + 1)
-        window_data = data.iloc[window_start:window_end]
+        window_lows = low[window_start:window_end]
         
-        if not window_data.empty and len(window_data) > 1:
+        if window_lows.size > 1:
             # Use relative ranking for local minimum (inverse logic from MC)
-            window_lows = window_data['Low'].values
-            cd_rank = sum(cd_price <= l for l in window_lows) / len(window_lows)
+            cd_rank = np.count_nonzero(window_lows >= cd_price) / len(window_lows)
             
             # CD signal is local min if it's in bottom 30% of surrounding prices
             is_local_min = cd_rank >= 0.7
@@ -114,11 +180,8 @@ def evaluate_cd_at_bottom_price(data, cd_date, cd_price, mc_date):
             metrics['is_local_minimum'] = False
         
         # 4. Overall evaluation - CD signal is at "bottom price" if it meets multiple criteria
-        criteria_met = sum([
-            metrics['is_near_lookback_low'],
-            metrics['is_followed_by_increase'],
-            metrics['is_local_minimum']
-        ])
+        # Integer sum of the three flags, without building a list for sum()
+        criteria_met = int(metrics['is_near_lookback_low']) + int(metrics['is_followed_by_increase']) + int(metrics['is_local_minimum'])
         
         metrics['criteria_met'] = criteria_met
         metrics['is_at_bottom_price'] = criteria_met >= 2  # At least 2 out of 3 criteria
@@ -137,7 +200,115 @@ def evaluate_cd_at_bottom_price(data, cd_date, cd_price, mc_date):
             'is_at_bottom_price': False
         }
 
-def calculate_returns(data, mc_signals, periods=None, max_signals=MAX_SIGNALS_THRESHOLD):
+def _signal_return_matrices(data, signal_idx, periods_arr, max_signals, bars):
+    """
+    Gather returns and volumes for the latest MC signals as (signal, period) matrices.
+    
+    Args:
+        data: DataFrame with price data
+        signal_idx: Integer positions of the MC signals in data
+        periods_arr: Array of periods to calculate returns for
+        max_signals: Maximum number of latest signals to process
+        bars: Bars (column arrays) of data
+    
+    Returns:
+        Tuple of (signal positions used, returns matrix, volumes matrix)
+    """
+    # Limit to the latest N signals to reduce noise from older signals
+    if len(signal_idx) > max_signals:
+        signal_idx = signal_idx[-max_signals:]
+    
+    # Skip signals that are too close to the end of the data
+    signal_idx = signal_idx[signal_idx + periods_arr.max() < len(data)]
+    if len(signal_idx) == 0:
+        # Every signal is too recent for the longest period; skip building the matrices
+        return signal_idx, np.empty((0, len(periods_arr))), np.empty((0, len(periods_arr)))
+    
+    # Gather entry/exit prices for every (signal, period) pair in one shot
+    # For MC signals, we're looking at returns from selling (negative returns indicate profit)
+    close = bars.close
+    entry_price = close[signal_idx][:, None]
+    returns_matrix = np.round((gather_periods(close, signal_idx, periods_arr) - entry_price) / entry_price * 100, 2)
+    # Volumes stay float so missing (NaN) bars can be masked out; only the stored values are cast to int
+    volumes_matrix = gather_periods(bars.volume, signal_idx, periods_arr).astype(np.float64)
+    return signal_idx, returns_matrix, volumes_matrix
+
+def _cd_analysis(data, signal_idx, bars=None, cd_signals=None):
+    """
+    Evaluate the latest CD signal before each MC signal.
+    
+    Args:
+        data: DataFrame with price data
+        signal_idx: Integer positions of the MC signals to analyze
+        bars: Optional precomputed Bars (column arrays) of data
+        cd_signals: Optional precomputed Series with CD signals (computed when not given)
+    
+    Returns:
+        Dictionary of CD signal analysis columns, one value per MC signal
+    """
+    if bars is None:
+        bars = Bars.from_frame(data)
+    if cd_signals is None:
+        # Also compute CD signals for analysis
+        cd_signals = cached_cd_indicator(data)
+    
+    # Columns default to the "no CD signal" values and are filled in for the MC signals that have one
+    signal_count = len(signal_idx)
+    prev_cd_date = np.full(signal_count, None, dtype=object)
+    prev_cd_price = np.full(signal_count, None, dtype=object)
+    cd_at_bottom_price = np.zeros(signal_count, dtype=bool)
+    cd_price_percentile = np.zeros(signal_count)
+    cd_increase_after = np.zeros(signal_count)
+    cd_criteria_met = np.zeros(signal_count, dtype=np.int64)
+    
+    # Raw price columns shared by every per-signal evaluation
+    high, low = bars.high, bars.low
+    
+    # Running max/min from the warmup period answer every lookback range query with one index
+    # (fmax/fmin skip NaN like the pandas reductions)
+    warmup_start = min(EMA_WARMUP_PERIOD, len(data) - 1)
+    running_high = np.fmax.accumulate(high[warmup_start:])
+    running_low = np.fmin.accumulate(low[warmup_start:])
+    
+    # Position of each MC signal's latest earlier CD signal (-1 when there is none), found in one search
+    prev_cd_idx = find_latest_cd_signals_before_mc(signal_idx, cd_signals)
+    close = bars.close
+    
+    for i, (mc_idx, date) in enumerate(zip(signal_idx, data.index[signal_idx])):
+        cd_idx = int(prev_cd_idx[i])
+        if cd_idx < 0:
+            continue
+        
+        # Evaluate if the CD signal was at bottom price
+        latest_cd_price = close[cd_idx]
+        cd_evaluation = evaluate_cd_at_bottom_price(data, data.index[cd_idx], latest_cd_price, date,
+                                                    cd_idx=cd_idx, mc_idx=int(mc_idx), high=high, low=low,
+                                                    running_high=running_high, running_low=running_low)
+        
+        # Prices become a float column (NaN where missing) once any MC signal has a CD signal
+        if prev_cd_price.dtype == object:
+            prev_cd_price = np.full(signal_count, np.nan)
+        prev_cd_price[i] = round(float(latest_cd_price), 2) if latest_cd_price else np.nan
+        cd_at_bottom_price[i] = cd_evaluation['is_at_bottom_price']
+        cd_price_percentile[i] = round(float(cd_evaluation['lookback_price_percentile']), 2)
+        cd_increase_after[i] = round(float(cd_evaluation['price_increase_after_cd']), 2)
+        cd_criteria_met[i] = cd_evaluation['criteria_met']
+    
+    has_cd = prev_cd_idx >= 0
+    if has_cd.any():
+        prev_cd_date[has_cd] = data.index[prev_cd_idx[has_cd]].strftime('%Y-%m-%d %H:%M:%S')
+    
+    return {
+        'prev_cd_date': prev_cd_date,
+        'prev_cd_price': prev_cd_price,
+        'cd_at_bottom_price': cd_at_bottom_price,
+        'cd_price_percentile': cd_price_percentile,
+        'cd_increase_after': cd_increase_after,
+        'cd_criteria_met': cd_criteria_met
+    }
+
+def calculate_returns(data, mc_signals, periods=None, max_signals=MAX_SIGNALS_THRESHOLD, signal_idx=None,
+                      cd_signals=None, bars=None):
     """
     Calculate returns after MC signals for specified periods.
     
@@ -146,83 +317,49 @@ def calculate_returns(data, mc_signals, periods=None, max_signals=MAX_SIGNALS_TH
         mc_signals: Series with MC signals (boolean)
         periods: List of periods to calculate returns for (default: 0 to 100)
         max_signals: Maximum number of latest signals to process (default: MAX_SIGNALS_THRESHOLD)
+        signal_idx: Optional precomputed integer positions of the MC signals in data
+        cd_signals: Optional precomputed Series with CD signals for the CD analysis columns
+        bars: Optional precomputed Bars (column arrays) of data
     
     Returns:
         DataFrame with signal dates, returns, and volume data for each period
     """
     if periods is None:
-        periods = [0] + list(range(1, 101))  # Full range from 0 to 100
-    results = []
-    # Handle NaN values by replacing them with False for boolean indexing
-    mc_signals_bool = mc_signals.fillna(False).infer_objects(copy=False)
-    signal_dates = data.index[mc_signals_bool]
-    
-    # Limit to the latest N signals to reduce noise from older signals
-    if len(signal_dates) > max_signals:
-        signal_dates = signal_dates[-max_signals:]
+        periods_arr, return_cols, volume_cols = PERIODS_ARR, RETURN_COLS, VOLUME_COLS
+    else:
+        periods_arr = np.asarray(periods, dtype=np.int64)
+        return_cols = [f'return_{period}' for period in periods]
+        volume_cols = [f'volume_{period}' for period in periods]
+    if signal_idx is None:
+        # Handle NaN values by replacing them with False for boolean indexing
+        mc_signals_bool = mc_signals.fillna(False).infer_objects(copy=False)
+        signal_idx = np.flatnonzero(mc_signals_bool.to_numpy(dtype=bool))
+    if bars is None:
+        bars = Bars.from_frame(data)
     
-    # Also compute CD signals for analysis
-    cd_signals = compute_cd_indicator(data)
+    signal_idx, returns_matrix, volumes_matrix = _signal_return_matrices(data, signal_idx, periods_arr, max_signals, bars)
+    if len(signal_idx) == 0:
+        return pd.DataFrame()
+    if np.isfinite(volumes_matrix).all():
+        volumes_matrix = volumes_matrix.astype(np.int64)  # Integer volume columns unless a bar has no volume
     
-    for date in signal_dates:
-        idx = data.index.get_loc(date)
-        
-        # Skip signals that are too close to the end of the data
-        if idx + max(periods) >= len(data):
-            continue
-            
-        entry_price = data.loc[date, 'Close']
-        entry_volume = data.loc[date, 'Volume']
-        returns = {}
-        volumes = {}
-        
-        for period in periods:
-            if idx + period < len(data):
-                exit_price = data.iloc[idx + period]['Close']
-                exit_volume = data.iloc[idx + period]['Volume']
-                # For MC signals, we're looking at returns from selling (negative returns indicate profit)
-                returns[f'return_{period}'] = round(float((exit_price - entry_price) / entry_price * 100), 2)  # Convert to Python float
-                volumes[f'volume_{period}'] = round(int(exit_volume), 0)  # Convert to Python int
-            else:
-                returns[f'return_{period}'] = np.nan
-                volumes[f'volume_{period}'] = np.nan
-        
-        # Find the latest CD signal before this MC signal
-        latest_cd_date, latest_cd_price = find_latest_cd_signal_before_mc(data, date, cd_signals)
-        
-        # Evaluate if the CD signal was at bottom price
-        cd_evaluation = {}
-        if latest_cd_date is not None:
-            cd_evaluation = evaluate_cd_at_bottom_price(data, latest_cd_date, latest_cd_price, date)
-            
-        # Add CD signal analysis to the results
-        cd_info = {
-            'prev_cd_date': latest_cd_date.strftime('%Y-%m-%d %H:%M:%S') if latest_cd_date else None,
-            'prev_cd_price': round(float(latest_cd_price), 2) if latest_cd_price else None,
-            'cd_at_bottom_price': cd_evaluation.get('is_at_bottom_price', False),
-            'cd_price_percentile': round(float(cd_evaluation.get('lookback_price_percentile', 0)), 2),
-            'cd_increase_after': round(float(cd_evaluation.get('price_increase_after_cd', 0)), 2),
-            'cd_criteria_met': cd_evaluation.get('criteria_met', 0)
-        }
-                
-        results.append({
-            'date': date,
-            'entry_volume': entry_volume,
-            **returns,
-            **volumes,
-            **cd_info
-        })
-    
-    return pd.DataFrame(results)
+    return pd.DataFrame({
+        'date': data.index[signal_idx],
+        'entry_volume': bars.volume[signal_idx],
+        **{col: returns_matrix[:, i] for i, col in enumerate(return_cols)},
+        **{col: volumes_matrix[:, i] for i, col in enumerate(volume_cols)},
+        **_cd_analysis(data, signal_idx, bars, cd_signals)
+    })
 
-def evaluate_interval(ticker, interval, data=None):
+def evaluate_interval(ticker, interval, data=None, mc_signals=None):
     """
     Evaluate MC signals for a specific ticker and interval.
     
     Args:
         ticker: Stock ticker symbol
         interval: Time interval to evaluate
-        data: Optional pre-downloaded data dictionary
+        data: Optional pre-downloaded data dictionary (intervals missing from it are downloaded)
+        mc_signals: Optional precomputed Series with MC signals for the interval's data frame
     
     Returns:
         Dictionary with evaluation metrics and individual returns
@@ -240,90 +377,57 @@ def evaluate_interval(ticker, interval, data=None):
                 if data and '1d' in data and not data['1d'].empty:
                     daily_data = data['1d']
                 else:
-                    stock = yf.Ticker(ticker)
-                    daily_data = stock.history(interval='1d', period='1y')
+                    daily_data = get_daily_history(ticker)
                     
                 if daily_data.empty:
                     return None
                     
                 # Resample daily data to weekly
-                data_frame = daily_data.resample('W').agg({
-                    'Open': 'first',
-                    'High': 'max',
-                    'Low': 'min',
-                    'Close': 'last',
-                    'Volume': 'sum'
-                })
+                data_frame = resample_weekly(daily_data, ticker)
             # Get data based on interval type
             elif interval in ['5m', '10m', '15m', '30m', '1h', '2h', '3h', '4h']:
                 data_ticker = download_stock_data(ticker, end_date=None)
                 data_frame = data_ticker[interval]
             elif interval == '1d':
-                stock = yf.Ticker(ticker)
-                data_frame = stock.history(interval='1d', period='1y')
+                data_frame = get_daily_history(ticker)
             else:
                 return None
                 
         if data_frame.empty:
             return None
-            
-        # Compute MC signals
-        mc_signals = compute_mc_indicator(data_frame)
-        # Handle NaN values for signal count calculation
-        signal_count = mc_signals.fillna(False).infer_objects(copy=False).sum()
         
-        # Get the latest signal date
+        # Column arrays shared by all positional lookups below
+        bars = Bars.from_frame(data_frame)
+            
+        # Compute MC signals (unless the caller already has them)
+        if mc_signals is None:
+            mc_signals = cached_mc_indicator(data_frame)
+        # Signal positions give both the signal count and the latest signal in one pass
         # Handle NaN values by replacing them with False for boolean indexing
         mc_signals_bool = mc_signals.fillna(False).infer_objects(copy=False)
-        latest_signal_date = data_frame.index[mc_signals_bool].max() if signal_count > 0 else None
+        signal_idx = np.flatnonzero(mc_signals_bool.to_numpy(dtype=bool))
+        signal_count = int(signal_idx.size)
+        
+        # Get the latest signal date
+        latest_signal_date = data_frame.index[signal_idx[-1]] if signal_count > 0 else None
         latest_signal_str = latest_signal_date.strftime('%Y-%m-%d %H:%M:%S') if latest_signal_date else None
-        latest_signal_price = round(float(data_frame.loc[latest_signal_date, 'Close']), 2) if latest_signal_date is not None else None  # Convert to Python float
+        latest_signal_price = round(float(bars.close[signal_idx[-1]]), 2) if latest_signal_date is not None else None  # Convert to Python float
         
         # Get current time and price
         current_time = data_frame.index[-1]
         current_time_str = current_time.strftime('%Y-%m-%d %H:%M:%S')
-        current_price = round(float(data_frame.iloc[-1]['Close']), 2)  # Convert to Python float
+        current_price = round(float(bars.close[-1]), 2)  # Convert to Python float
         
         if signal_count == 0:
-            result = {
+            result = _empty_result({
                 'ticker': ticker,
                 'interval': interval,
                 'signal_count': 0,
                 'latest_signal': None,
                 'latest_signal_price': None,
                 'current_time': current_time_str,
-                'current_price': current_price,
-                'current_period': 0,
-                'max_return': 0,
-                'min_return': 0,
-                'price_history': {},
-                'volume_history': {}
-            }
-            # Add zero values for all periods
-            periods = [0] + list(range(1, 101))  # Full range from 0 to 100
-            for period in periods:
-                result[f'test_count_{period}'] = 0
-                result[f'success_rate_{period}'] = 0
-                result[f'avg_return_{period}'] = 0
-                result[f'avg_volume_{period}'] = 0
-                result[f'returns_{period}'] = []  # Store empty list for individual returns
-                result[f'volumes_{period}'] = []  # Store empty list for individual volumes
-            
-            # Add CD signal analysis fields
-            result['cd_signals_before_mc'] = 0
-            result['cd_at_bottom_price_count'] = 0
-            result['cd_at_bottom_price_rate'] = 0
-            result['avg_cd_price_percentile'] = 0
-            result['avg_cd_increase_after'] = 0
-            result['avg_cd_criteria_met'] = 0
-            
-            # Add latest CD signal data (all None/False when no data)
-            result['latest_cd_date'] = None
-            result['latest_cd_price'] = None
-            result['latest_cd_at_bottom_price'] = False
-            result['latest_cd_price_percentile'] = 0
-            result['latest_cd_increase_after'] = 0
-            result['latest_cd_criteria_met'] = 0
+                'current_price': current_price
+            })
             
             # Add NX values (both signal and current values)
             result['nx_1d_signal'] = None
@@ -351,52 +455,20 @@ def evaluate_interval(ticker, interval, data=None):
             return result
             
         # Calculate returns for each signal (limit to latest signals to reduce noise)
-        returns_df = calculate_returns(data_frame, mc_signals, max_signals=MAX_SIGNALS_THRESHOLD)
+        # The (signal, period) matrices are used directly instead of going through a returns DataFrame
+        returns_idx, returns_matrix, volumes_matrix = _signal_return_matrices(
+            data_frame, signal_idx, PERIODS_ARR, MAX_SIGNALS_THRESHOLD, bars)
         
-        if returns_df.empty:
-            result = {
+        if len(returns_idx) == 0:
+            return _empty_result({
                 'ticker': ticker,
                 'interval': interval,
                 'signal_count': signal_count,
                 'latest_signal': latest_signal_str,
                 'latest_signal_price': latest_signal_price,
                 'current_time': current_time_str,
-                'current_price': current_price,
-                'current_period': 0,
-                'max_return': 0,
-                'min_return': 0,
-                'price_history': {},
-                'volume_history': {}
-            }
-            # Add zero values for all periods
-            periods = [0] + list(range(1, 101))  # Full range from 0 to 100
-            for period in periods:
-                result[f'test_count_{period}'] = 0
-                result[f'success_rate_{period}'] = 0
-                result[f'avg_return_{period}'] = 0
-                result[f'avg_volume_{period}'] = 0
-                result[f'returns_{period}'] = []  # Store empty list for individual returns
-                result[f'volumes_{period}'] = []  # Store empty list for individual volumes
-            
-            # Add CD signal analysis fields
-            result['cd_signals_before_mc'] = 0
-            result['cd_at_bottom_price_count'] = 0
-            result['cd_at_bottom_price_rate'] = 0
-            result['avg_cd_price_percentile'] = 0
-            result['avg_cd_increase_after'] = 0
-            result['avg_cd_criteria_met'] = 0
-            
-            # Add latest CD signal data (all None/False when no data)
-            result['latest_cd_date'] = None
-            result['latest_cd_price'] = None
-            result['latest_cd_at_bottom_price'] = False
-            result['latest_cd_price_percentile'] = 0
-            result['latest_cd_increase_after'] = 0
-            result['latest_cd_criteria_met'] = 0
-            return result
-        
-        # Define all periods
-        periods = [0] + list(range(1, 101))  # Full range from 0 to 100
+                'current_price': current_price
+            })
         
         # Initialize result dictionary with basic info
         result = {
@@ -412,33 +484,27 @@ def evaluate_interval(ticker, interval, data=None):
         # Calculate current period if there's a latest signal
         if latest_signal_date:
             # Find the index of the latest signal and current time
-            signal_idx = data_frame.index.get_loc(latest_signal_date)
-            current_idx = len(data_frame) - 1
+            latest_signal_idx = signal_idx[-1]
+            current_idx = len(bars) - 1
             # Calculate current period as the number of data points between signal and current time
-            current_period = current_idx - signal_idx
+            current_period = int(current_idx - latest_signal_idx)
             
             # Calculate actual price history and volume history for the latest signal
-            price_history = {}
-            volume_history = {}
-            entry_price = data_frame.loc[latest_signal_date, 'Close']
-            entry_volume = data_frame.loc[latest_signal_date, 'Volume']
-            price_history[0] = round(float(entry_price), 2)  # Entry price at period 0, convert to Python float
-            volume_history[0] = round(int(entry_volume), 0)  # Entry volume at period 0, convert to Python int
-            
-            for period in periods:
-                if signal_idx + period < len(data_frame):
-                    actual_price = data_frame.iloc[signal_idx + period]['Close']
-                    actual_volume = data_frame.iloc[signal_idx + period]['Volume']
-                    price_history[period] = round(float(actual_price), 2)  # Convert to Python float
-                    volume_history[period] = round(int(actual_volume), 0)  # Convert to Python int
-                else:
-                    price_history[period] = None
-                    volume_history[period] = None
+            # (period 0 is the entry bar; periods past the end of the data are None)
+            available_periods = len(bars) - latest_signal_idx
+            price_history = {
+                period: round(float(bars.close[latest_signal_idx + period]), 2) if period < available_periods else None  # Convert to Python float
+                for period in PERIODS
+            }
+            volume_history = {
+                period: int(bars.volume[latest_signal_idx + period]) if period < available_periods else None  # Convert to Python int
+                for period in PERIODS
+            }
                     
             # Add current price and volume if we're beyond the latest period
-            if current_period > max(periods):
+            if current_period > PERIODS[-1]:
                 price_history[current_period] = round(float(current_price), 2)  # Convert to Python float
-                volume_history[current_period] = round(int(data_frame.iloc[-1]['Volume']), 0)  # Convert to Python int
+                volume_history[current_period] = int(bars.volume[-1])  # Convert to Python int
         else:
             current_period = 0
             price_history = {}
@@ -448,58 +514,68 @@ def evaluate_interval(ticker, interval, data=None):
         result['price_history'] = price_history
         result['volume_history'] = volume_history
         
-        # Calculate aggregated statistics for each period
-        all_returns = []
-        for period in periods:
-            period_returns = returns_df[f'return_{period}'].dropna()
-            period_volumes = returns_df[f'volume_{period}'].dropna() if f'volume_{period}' in returns_df else pd.Series([], dtype='float64')
-            
-            if len(period_returns) > 0:
-                # For MC signals, negative returns indicate profit (price decline after sell signal)
-                # So we calculate success rate as percentage of negative returns
-                success_rate = round(float((period_returns < 0).mean() * 100), 2)  # Convert to Python float
-                avg_return = round(float(period_returns.mean()), 2)  # Convert to Python float
-                avg_volume = round(int(period_volumes.mean()), 0) if len(period_volumes) > 0 else 0  # Convert to Python int
+        # Calculate metrics for all periods at once with column reductions over the returns matrix
+        valid = ~np.isnan(returns_matrix)
+        test_counts = valid.sum(axis=0)
+        # For MC signals, negative returns indicate profit (price decline after sell signal)
+        # So we calculate success rate as percentage of negative returns
+        success_counts = (returns_matrix < 0).sum(axis=0)
+        return_sums = np.where(valid, returns_matrix, 0).sum(axis=0)
+        volume_valid = np.isfinite(volumes_matrix)
+        volume_counts = volume_valid.sum(axis=0)
+        volume_sums = np.where(volume_valid, volumes_matrix, 0).sum(axis=0)
+        
+        # Per-period rates and averages in one vectorized pass, converted to Python floats once
+        with np.errstate(invalid='ignore', divide='ignore'):
+            success_rates = (success_counts / test_counts * 100).tolist()
+            avg_returns = (return_sums / test_counts).tolist()
+            avg_volumes = (volume_sums / volume_counts).tolist()
+        
+        for i in range(len(PERIODS)):
+            if test_counts[i] > 0:
+                # The returns matrix is already rounded to 2 decimals
+                period_returns = returns_matrix[valid[:, i], i]
+                period_volumes = volumes_matrix[volume_valid[:, i], i]
                 
                 # Store aggregated metrics
-                result[f'test_count_{period}'] = len(period_returns)
-                result[f'success_rate_{period}'] = success_rate
-                result[f'avg_return_{period}'] = avg_return
-                result[f'avg_volume_{period}'] = avg_volume
-                result[f'returns_{period}'] = [round(float(x), 2) for x in period_returns.tolist()]  # Convert to Python float
-                result[f'volumes_{period}'] = [round(int(x), 0) for x in period_volumes.tolist()]  # Convert to Python int
-                
-                all_returns.extend(period_returns.tolist())
+                result[TEST_COUNT_KEYS[i]] = int(test_counts[i])
+                result[SUCCESS_RATE_KEYS[i]] = round(success_rates[i], 2)
+                result[AVG_RETURN_KEYS[i]] = round(avg_returns[i], 2)
+                result[AVG_VOLUME_KEYS[i]] = int(avg_volumes[i]) if volume_counts[i] > 0 else 0  # Convert to Python int
+                result[RETURNS_KEYS[i]] = period_returns.tolist()  # Convert to Python float
+                result[VOLUMES_KEYS[i]] = period_volumes.astype(np.int64).tolist()  # Convert to Python int
             else:
-                result[f'test_count_{period}'] = 0
-                result[f'success_rate_{period}'] = 0
-                result[f'avg_return_{period}'] = 0
-                result[f'avg_volume_{period}'] = 0
-                result[f'returns_{period}'] = []
-                result[f'volumes_{period}'] = []
+                result[TEST_COUNT_KEYS[i]] = 0
+                result[SUCCESS_RATE_KEYS[i]] = 0
+                result[AVG_RETURN_KEYS[i]] = 0
+                result[AVG_VOLUME_KEYS[i]] = 0
+                result[RETURNS_KEYS[i]] = []
+                result[VOLUMES_KEYS[i]] = []
         
         # Add CD signal analysis summary to the result
-        if not returns_df.empty:
+        cd_df = pd.DataFrame({'date': data_frame.index[returns_idx], **_cd_analysis(data_frame, returns_idx, bars)})
+        if not cd_df.empty:
             # Calculate CD signal statistics
-            cd_at_bottom_count = returns_df['cd_at_bottom_price'].sum() if 'cd_at_bottom_price' in returns_df else 0
-            cd_total_count = len(returns_df[returns_df['prev_cd_date'].notna()]) if 'prev_cd_date' in returns_df else 0
+            cd_at_bottom_count = int(np.count_nonzero(cd_df['cd_at_bottom_price'].to_numpy(dtype=bool)))
+            has_prev_cd = cd_df['prev_cd_date'].notna()
+            cd_total_count = int(np.count_nonzero(has_prev_cd.to_numpy()))
             cd_at_bottom_rate = round(float((cd_at_bottom_count / cd_total_count * 100)), 2) if cd_total_count > 0 else 0
             
             # Average CD evaluation metrics
-            avg_cd_percentile = round(float(returns_df['cd_price_percentile'].mean()), 2) if 'cd_price_percentile' in returns_df else 0  # Convert to Python float
-            avg_cd_increase = round(float(returns_df['cd_increase_after'].mean()), 2) if 'cd_increase_after' in returns_df else 0  # Convert to Python float
-            avg_cd_criteria = round(float(returns_df['cd_criteria_met'].mean()), 2) if 'cd_criteria_met' in returns_df else 0  # Convert to Python float
+            avg_cd_percentile = round(float(cd_df['cd_price_percentile'].mean()), 2)  # Convert to Python float
+            avg_cd_increase = round(float(cd_df['cd_increase_after'].mean()), 2)  # Convert to Python float
+            avg_cd_criteria = round(float(cd_df['cd_criteria_met'].mean()), 2)  # Convert to Python float
             
             # Latest CD signal data (from the most recent MC signal)
-            latest_mc_signal = returns_df[returns_df['prev_cd_date'].notna()].sort_values('date', ascending=False)
-            if not latest_mc_signal.empty:
-                latest_cd_data = latest_mc_signal.iloc[0]
-                latest_cd_price = latest_cd_data['prev_cd_price'] if 'prev_cd_price' in latest_cd_data else None
-                latest_cd_date = latest_cd_data['prev_cd_date'] if 'prev_cd_date' in latest_cd_data else None
-                latest_cd_at_bottom_price = latest_cd_data['cd_at_bottom_price'] if 'cd_at_bottom_price' in latest_cd_data else False
-                latest_cd_price_percentile = latest_cd_data['cd_price_percentile'] if 'cd_price_percentile' in latest_cd_data else 0
-                latest_cd_increase_after = latest_cd_data['cd_increase_after'] if 'cd_increase_after' in latest_cd_data else 0
-                latest_cd_criteria_met = latest_cd_data['cd_criteria_met'] if 'cd_criteria_met' in latest_cd_data else 0
+            if cd_total_count > 0:
+                # Row with the latest date among those with a CD signal (argmax instead of a full sort)
+                latest_cd_data = cd_df.loc[cd_df.loc[has_prev_cd, 'date'].idxmax()]
+                latest_cd_price = latest_cd_data['prev_cd_price']
+                latest_cd_date = latest_cd_data['prev_cd_date']
+                latest_cd_at_bottom_price = latest_cd_data['cd_at_bottom_price']
+                latest_cd_price_percentile = latest_cd_data['cd_price_percentile']
+                latest_cd_increase_after = latest_cd_data['cd_increase_after']
+                latest_cd_criteria_met = latest_cd_data['cd_criteria_met']
             else:
                 latest_cd_price = None
                 latest_cd_date = None
@@ -519,10 +595,10 @@ def evaluate_interval(ticker, interval, data=None):
             # Add latest CD signal data
             result['latest_cd_date'] = latest_cd_date
             result['latest_cd_price'] = round(float(latest_cd_price), 2) if latest_cd_price else None  # Convert to Python float
-            result['latest_cd_at_bottom_price'] = latest_cd_at_bottom_price
+            result['latest_cd_at_bottom_price'] = bool(latest_cd_at_bottom_price)  # Convert to Python bool
             result['latest_cd_price_percentile'] = round(float(latest_cd_price_percentile), 2)  # Convert to Python float
             result['latest_cd_increase_after'] = round(float(latest_cd_increase_after), 2)  # Convert to Python float
-            result['latest_cd_criteria_met'] = latest_cd_criteria_met
+            result['latest_cd_criteria_met'] = int(latest_cd_criteria_met)  # Convert to Python int
         else:
             result['cd_signals_before_mc'] = 0
             result['cd_at_bottom_price_count'] = 0
@@ -539,13 +615,10 @@ def evaluate_interval(ticker, interval, data=None):
             result['latest_cd_increase_after'] = 0
             result['latest_cd_criteria_met'] = 0
         
-        # Calculate overall min/max returns
-        if all_returns:
-            result['max_return'] = round(float(max(all_returns)), 2)  # Convert to Python float
-            result['min_return'] = round(float(min(all_returns)), 2)  # Convert to Python float
-        else:
-            result['max_return'] = 0
-            result['min_return'] = 0
+        # Calculate max and min returns across all periods with single reductions over the matrix
+        has_returns = bool(valid.any())
+        result['max_return'] = round(float(np.nanmax(returns_matrix)), 2) if has_returns else 0  # Convert to Python float
+        result['min_return'] = round(float(np.nanmin(returns_matrix)), 2) if has_returns else 0  # Convert to Python float
         
         # Add NX values (both signal and current values)
         # Add NX values (both signal and current values)
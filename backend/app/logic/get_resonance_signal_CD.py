@@ -1,47 +1,70 @@
 import pandas as pd
+import numpy as np
 from indicators import compute_cd_indicator, compute_nx_break_through
-from utils import calculate_current_nx_values, get_trading_day_window_end
+from utils import calculate_current_nx_values, find_resonance_candidates
     
+# Score weight of each signal interval (longer intervals weigh more)
+INTERVAL_WEIGHTS = {
+    # '1m': 1, 
+    # '2m': 2, 
+    '5m': 2, 
+    '10m': 3,
+    '15m': 4,
+    '30m': 5, 
+    '1h': 6, 
+    '2h': 7,
+    '3h': 8,
+    '4h': 9,
+    '1d': 10
+}
+
 def calculate_score(data, interval, signal_date):
-    interval_weights = {
-        # '1m': 1, 
-        # '2m': 2, 
-        '5m': 2, 
-        '10m': 3,
-        '15m': 4,
-        '30m': 5, 
-        '1h': 6, 
-        '2h': 7,
-        '3h': 8,
-        '4h': 9,
-        '1d': 10
-    }
-    iw = interval_weights.get(interval, 0)
+    # Single-signal form of calculate_scores, so both share one scoring rule
+    return calculate_scores(data, interval, [data.index.get_loc(signal_date)])[0]
+
+def calculate_scores(data, interval, signal_pos):
+    """
+    Score all signals of one interval at once; the 20-bar average volume is computed once for
+    the whole series instead of once per signal.
     
-    # 获取信号当天的数据
-    row = data.loc[signal_date]
-    candle_size = round(float(abs(row['Close'] - row['Open']) / row['Close'] * 100), 2)  # Convert to Python float
+    Args:
+        data: DataFrame with price data
+        interval: Interval of the data
+        signal_pos: Integer positions of the signals in data
     
-    # 计算过去20天的平均成交量
-    avg_volume = data['Volume'].rolling(20).mean().loc[:signal_date].iloc[-1]
-    volume_ratio = row['Volume'] / avg_volume if avg_volume != 0 else 0
+    Returns:
+        List of scores, one per signal
+    """
+    iw = INTERVAL_WEIGHTS.get(interval, 0)
+    # Gather the signal bars once; candle sizes and volume ratios are then computed for all signals in one pass
+    signal_pos = np.asarray(signal_pos, dtype=np.intp)
+    close = data['Close'].to_numpy(dtype=np.float64)[signal_pos]
+    open_price = data['Open'].to_numpy(dtype=np.float64)[signal_pos]
+    volume = data['Volume'].to_numpy(dtype=np.float64)[signal_pos]
+    avg_volume = data['Volume'].rolling(20).mean().to_numpy()[signal_pos]
+    candle_pct = np.abs(close - open_price) / close * 100
+    with np.errstate(divide='ignore', invalid='ignore'):
+        volume_ratios = volume / avg_volume
     
-    score = iw * 0.5 + candle_size * 0.3 + volume_ratio * 0.2
-    return round(score, 2)
-
-def process_ticker_1234(ticker, data_ticker=None):
+    scores = []
+    for candle, ratio, avg in zip(candle_pct, volume_ratios, avg_volume):
+        candle_size = round(float(candle), 2)  # Convert to Python float
+        volume_ratio = ratio if avg != 0 else 0
+        scores.append(round(iw * 0.5 + candle_size * 0.3 + volume_ratio * 0.2, 2))
+    return scores
+
+def _process_ticker(ticker, intervals, data_ticker=None):
     """
-    Process ticker for 1234 breakout analysis
+    Process ticker for breakout analysis over the given intervals
     
     Args:
         ticker: Stock symbol
+        intervals: Intervals to scan for signals
         data_ticker: pre-downloaded data dictionary, key is interval, value is dataframe
     
     Returns:
         List of results
     """
-    intervals = ['1h', '2h', '3h', '4h']
-    
     results = []
     # Use provided data or download if not provided
     if data_ticker is None:
@@ -61,32 +84,50 @@ def process_ticker_1234(ticker, data_ticker=None):
             breakthrough = compute_nx_break_through(data)
             # Handle NaN values by replacing them with False for boolean operations
             cd_bool = cd.fillna(False).infer_objects(copy=False).astype(bool)
-            buy_signals = (cd_bool & breakthrough) | (cd_bool & breakthrough.rolling(10).apply(lambda x: x.iloc[0] if x.any() else False))   
+            # The oldest bar of the trailing 10-bar window (i.e. 9 bars back) must be a breakthrough
+            buy_signals = (cd_bool & breakthrough) | (cd_bool & breakthrough.shift(9, fill_value=False))   
             signal_dates = data.index[buy_signals]
             breakthrough_dates = data.index[breakthrough]
             
             # Filter out NaN values for signal processing
             valid_cd_signals = cd.fillna(False).infer_objects(copy=False)
-            for date in data.index[valid_cd_signals]:
-                score = calculate_score(data, interval, date)
-                signal_price = data.loc[date, 'Close']  # Get the Close price at signal date
-                # Find the next breakthrough date after the signal date
-                future_breakthroughs = breakthrough_dates[breakthrough_dates >= date]
-                next_breakthrough = future_breakthroughs[0] if len(future_breakthroughs) > 0 else None
+            signal_pos = np.flatnonzero(valid_cd_signals.to_numpy(dtype=bool))
+            scores = calculate_scores(data, interval, signal_pos)
+            close = data['Close'].to_numpy(dtype=np.float64)
+            # Format every signal and breakthrough date once instead of per result row
+            signal_date_strs = data.index[signal_pos].strftime('%Y-%m-%d %H:%M:%S')
+            breakthrough_date_strs = breakthrough_dates.strftime('%Y-%m-%d %H:%M:%S')
+            # Position of the next breakthrough at or after each signal date (breakthrough_dates is sorted)
+            next_bt_pos = breakthrough_dates.searchsorted(data.index[signal_pos], side='left')
+            for pos, date_str, bt_pos, score in zip(signal_pos, signal_date_strs, next_bt_pos, scores):
+                signal_price = close[pos]  # Get the Close price at signal date
+                next_breakthrough = breakthrough_date_strs[bt_pos] if bt_pos < len(breakthrough_date_strs) else None
 
                 results.append({
                     'ticker': ticker,
                     'interval': interval,
                     'score': score,
-                    'signal_date': date.strftime('%Y-%m-%d %H:%M:%S'),
+                    'signal_date': date_str,
                     'signal_price': round(signal_price, 2),
-                    'breakthrough_date': next_breakthrough.strftime('%Y-%m-%d %H:%M:%S') if next_breakthrough is not None else None
+                    'breakthrough_date': next_breakthrough
                 })
         except Exception as e:
             print(f"Error processing {ticker} {interval}: {e}")
     
     return results
 
+def process_ticker_1234(ticker, data_ticker=None):
+    """
+    Process ticker for 1234 breakout analysis
+    
+    Args:
+        ticker: Stock symbol
+        data_ticker: pre-downloaded data dictionary, key is interval, value is dataframe
+    
+    Returns:
+        List of results
+    """
+    return _process_ticker(ticker, ['1h', '2h', '3h', '4h'], data_ticker)
 
 def process_ticker_5230(ticker, data_ticker=None):
     """
@@ -95,55 +136,11 @@ def process_ticker_5230(ticker, data_ticker=None):
     Args:
         ticker: Stock symbol
         data_ticker: pre-downloaded data dictionary, key is interval, value is dataframe
+    
     Returns:
         List of results
     """
-    intervals = ['5m', '10m', '15m', '30m']
-    
-    results = []
-    # Use provided data or download if not provided
-    if data_ticker is None:
-        print (f"data not provided for {ticker}")
-        # throw an error
-        raise ValueError(f"data not provided for {ticker}") 
-
-    for interval in intervals:
-        print(f"ticker: {ticker} interval: {interval}")
-        data = data_ticker.get(interval, pd.DataFrame())
-        if data.empty:
-            print(f"data is empty: {ticker} {interval}")
-            continue
-        
-        try:
-            cd = compute_cd_indicator(data)
-            breakthrough = compute_nx_break_through(data)
-            # Handle NaN values by replacing them with False for boolean operations
-            cd_bool = cd.fillna(False).infer_objects(copy=False).astype(bool)
-            buy_signals = (cd_bool & breakthrough) | (cd_bool & breakthrough.rolling(10).apply(lambda x: x.iloc[0] if x.any() else False))   
-            signal_dates = data.index[buy_signals]
-            breakthrough_dates = data.index[breakthrough]
-            
-            # Filter out NaN values for signal processing
-            valid_cd_signals = cd.fillna(False).infer_objects(copy=False)
-            for date in data.index[valid_cd_signals]:
-                score = calculate_score(data, interval, date)
-                signal_price = data.loc[date, 'Close']  # Get the Close price at signal date
-                # Find the next breakthrough date after the signal date
-                future_breakthroughs = breakthrough_dates[breakthrough_dates >= date]
-                next_breakthrough = future_breakthroughs[0] if len(future_breakthroughs) > 0 else None
-
-                results.append({
-                    'ticker': ticker,
-                    'interval': interval,
-                    'score': score,
-                    'signal_date': date.strftime('%Y-%m-%d %H:%M:%S'),
-                    'signal_price': round(signal_price, 2),
-                    'breakthrough_date': next_breakthrough.strftime('%Y-%m-%d %H:%M:%S') if next_breakthrough is not None else None
-                })
-        except Exception as e:
-            print(f"Error processing {ticker} {interval}: {e}")
-    
-    return results
+    return _process_ticker(ticker, ['5m', '10m', '15m', '30m'], data_ticker)
 
 
 def identify_1234(data, all_ticker_data):
@@ -182,45 +179,11 @@ def identify_1234(data, all_ticker_data):
     # Filter for rows whose interval is in our required set
     df = df[df["interval"].isin(required_intervals)]
 
-    breakout_candidates = []
-    processed_combinations = set()  # Track (ticker, date) combinations to avoid duplicates
-
-    # Group data by ticker
     # Convert signal_date to date only (removing time component)
     df['date'] = df['signal_date'].dt.date
 
-    # Use sorted unique dates to ensure proper time window calculation
-    unique_dates = sorted(df['date'].unique())
-    # Get unique dates to iterate through
-    for i in range(len(unique_dates)):
-        date = unique_dates[i]
-        # Get data within BROAD window (e.g. 10 days) to assume coverage
-        window_end_broad = date + pd.Timedelta(days=10)
-        window_data_broad = df[(df['date'] >= date) & 
-                        (df['date'] < window_end_broad)]
-        
-        # Check each ticker in this window
-        for ticker in window_data_broad['ticker'].unique():
-            # Apply precise trading day window
-            precise_end_date = get_trading_day_window_end(date, ticker, all_ticker_data, days=3)
-            
-            ticker_data = window_data_broad[(window_data_broad['ticker'] == ticker) & 
-                                            (window_data_broad['date'] < precise_end_date + pd.Timedelta(days=1))] # precise_end is inclusive day
-            
-            unique_intervals = set(ticker_data['interval'])
-
-            if len(unique_intervals.intersection(required_intervals)) >= 3:
-                # Get the most recent signal date within this window for this ticker
-                most_recent_signal_date = ticker_data['signal_date'].max().date()
-                # Check if we've already processed this combination
-                combination = (ticker, most_recent_signal_date)
-                if combination not in processed_combinations:
-                    processed_combinations.add(combination)
-                    # Get the latest signal price for this ticker/date combination (most recent signal)
-                    latest_signal_price = ticker_data.loc[ticker_data['signal_date'].idxmax(), 'signal_price'] if 'signal_price' in ticker_data.columns and not ticker_data.empty else None
-                    resonating_intervals_set = unique_intervals.intersection(required_intervals)
-                    intervals_str = ",".join(map(str, sorted([int(s.replace('h', '')) for s in resonating_intervals_set])))
-                    breakout_candidates.append([ticker, most_recent_signal_date, intervals_str, latest_signal_price])
+    # Sweep each ticker's signals once for resonating trading-day windows
+    breakout_candidates = find_resonance_candidates(df, required_intervals, all_ticker_data, 'h')
     
     # Include signal_price column if available
     columns = ['ticker', 'date', 'intervals']
@@ -229,16 +192,22 @@ def identify_1234(data, all_ticker_data):
         
     df_breakout_candidates = pd.DataFrame(breakout_candidates, columns=columns).sort_values(by=['date', 'ticker'], ascending=[False, True])
 
-    current_data = df_breakout_candidates['ticker'].apply(lambda ticker: 
-        (
-            round(all_ticker_data[ticker]['1d'].iloc[-1]['Close'], 2),
-            all_ticker_data[ticker]['1d'].iloc[-1].name.strftime('%Y-%m-%d %H:%M:%S')
+    # The latest 1d close and time only depend on the ticker, so look them up once per ticker
+    current_by_ticker = {
+        ticker: (
+            round(all_ticker_data[ticker]['1d']['Close'].iloc[-1], 2),
+            all_ticker_data[ticker]['1d'].index[-1].strftime('%Y-%m-%d %H:%M:%S')
         ) if ticker in all_ticker_data and '1d' in all_ticker_data[ticker] and not all_ticker_data[ticker]['1d'].empty else (None, None)
+        for ticker in df_breakout_candidates['ticker'].unique()
+    }
+    df_breakout_candidates[['current_price', 'current_time']] = pd.DataFrame(
+        [current_by_ticker[ticker] for ticker in df_breakout_candidates['ticker']],
+        index=df_breakout_candidates.index
     )
-    df_breakout_candidates[['current_price', 'current_time']] = pd.DataFrame(current_data.tolist(), index=df_breakout_candidates.index)
 
     dict_nx_1d = {}
     dict_nx_30m = {}
+    precomputed_nx = {}  # Full NX crossover series per ticker and interval
 
     for ticker in df_breakout_candidates['ticker'].unique():
         # Calculate nx_1d
@@ -252,8 +221,9 @@ def identify_1234(data, all_ticker_data):
         short_close = close.ewm(span = 24, adjust=False).mean()
         long_close = close.ewm(span = 89, adjust=False).mean()
         nx_1d = (short_close > long_close) 
+        precomputed_nx.setdefault(ticker, {})['1d'] = nx_1d
 
-        nx_1d.index = nx_1d.index.date
+        nx_1d = nx_1d.set_axis(nx_1d.index.date)
         dict_nx_1d[ticker] = nx_1d.to_dict()
 
         # Calculate nx_30m
@@ -267,6 +237,7 @@ def identify_1234(data, all_ticker_data):
         short_close_30m = close_30m.ewm(span = 24, adjust=False).mean()
         long_close_30m = close_30m.ewm(span = 89, adjust=False).mean()
         nx_30m = (short_close_30m > long_close_30m) 
+        precomputed_nx.setdefault(ticker, {})['30m'] = nx_30m
 
         # Convert to date and take the last value for each date (end of day value)
         nx_30m_daily = nx_30m.groupby(nx_30m.index.date).last()
@@ -282,24 +253,27 @@ def identify_1234(data, all_ticker_data):
         return df_breakout_candidates  # Return empty DataFrame
     
     # add nx_1d to df_breakout_candidates according to ticker and date
-    df_breakout_candidates['nx_1d_signal'] = df_breakout_candidates.apply(lambda row: dict_nx_1d[row['ticker']].get(row['date'], None), axis=1)
+    df_breakout_candidates['nx_1d_signal'] = [
+        dict_nx_1d[ticker].get(date, None)
+        for ticker, date in zip(df_breakout_candidates['ticker'], df_breakout_candidates['date'])
+    ]
     # add nx_30m to df_breakout_candidates according to ticker and date
-    df_breakout_candidates['nx_30m_signal'] = df_breakout_candidates.apply(lambda row: dict_nx_30m[row['ticker']].get(row['date'], None), axis=1)
+    df_breakout_candidates['nx_30m_signal'] = [
+        dict_nx_30m[ticker].get(date, None)
+        for ticker, date in zip(df_breakout_candidates['ticker'], df_breakout_candidates['date'])
+    ]
     
     # Add current nx values
-    # Prefer previously computed NX series to avoid recomputation
-    current_nx_data = df_breakout_candidates['ticker'].apply(
-        lambda ticker: calculate_current_nx_values(
-            ticker,
-            all_ticker_data,
-            precomputed_series={
-                '1d': dict_nx_1d.get(ticker),
-                '30m': dict_nx_30m.get(ticker),
-            }
-        )
-    )
+    # Current values only depend on the ticker, so compute them once per ticker from the NX series above
+    current_nx_by_ticker = {
+        ticker: calculate_current_nx_values(ticker, all_ticker_data, precomputed_series=precomputed_nx.get(ticker))
+        for ticker in df_breakout_candidates['ticker'].unique()
+    }
     # Assign columns individually to avoid duplicate column issues
-    current_nx_df = pd.DataFrame(current_nx_data.tolist(), index=df_breakout_candidates.index)
+    current_nx_df = pd.DataFrame(
+        [current_nx_by_ticker[ticker] for ticker in df_breakout_candidates['ticker']],
+        index=df_breakout_candidates.index
+    )
     df_breakout_candidates['nx_1d'] = current_nx_df['nx_1d']
     df_breakout_candidates['nx_1h'] = current_nx_df['nx_1h']
     df_breakout_candidates['nx_30m'] = current_nx_df['nx_30m']  
@@ -347,45 +321,11 @@ def identify_5230(data, all_ticker_data):
     # Filter for rows whose interval is in our required set
     df = df[df["interval"].isin(required_intervals)]
 
-    breakout_candidates = []
-    processed_combinations = set()  # Track (ticker, date) combinations to avoid duplicates
-
-    # Group data by ticker
     # Convert signal_date to date only (removing time component)
     df['date'] = df['signal_date'].dt.date
 
-    # Use sorted unique dates to ensure proper time window calculation
-    unique_dates = sorted(df['date'].unique())
-    # Get unique dates to iterate through
-    for i in range(len(unique_dates)):
-        date = unique_dates[i]
-        # Get data within BROAD window (e.g. 10 days) to assume coverage
-        window_end_broad = date + pd.Timedelta(days=10)
-        window_data_broad = df[(df['date'] >= date) & 
-                        (df['date'] < window_end_broad)]
-        
-        # Check each ticker in this window
-        for ticker in window_data_broad['ticker'].unique():
-            # Apply precise trading day window
-            precise_end_date = get_trading_day_window_end(date, ticker, all_ticker_data, days=3)
-            
-            ticker_data = window_data_broad[(window_data_broad['ticker'] == ticker) & 
-                                            (window_data_broad['date'] < precise_end_date + pd.Timedelta(days=1))] # precise_end is inclusive day
-            
-            unique_intervals = set(ticker_data['interval'])
-
-            if len(unique_intervals.intersection(required_intervals)) >= 3:
-                # Get the most recent signal date within this window for this ticker
-                most_recent_signal_date = ticker_data['signal_date'].max().date()
-                # Check if we've already processed this combination
-                combination = (ticker, most_recent_signal_date)
-                if combination not in processed_combinations:
-                    processed_combinations.add(combination)
-                    # Get the latest signal price for this ticker/date combination (most recent signal)
-                    latest_signal_price = ticker_data.loc[ticker_data['signal_date'].idxmax(), 'signal_price'] if 'signal_price' in ticker_data.columns and not ticker_data.empty else None
-                    resonating_intervals_set = unique_intervals.intersection(required_intervals)
-                    intervals_str = ",".join(map(str, sorted([int(s.replace('m', '')) for s in resonating_intervals_set])))
-                    breakout_candidates.append([ticker, most_recent_signal_date, intervals_str, latest_signal_price])
+    # Sweep each ticker's signals once for resonating trading-day windows
+    breakout_candidates = find_resonance_candidates(df, required_intervals, all_ticker_data, 'm')
     
     # Include signal_price column if available
     columns = ['ticker', 'date', 'intervals']
@@ -395,17 +335,23 @@ def identify_5230(data, all_ticker_data):
     df_breakout_candidates = pd.DataFrame(breakout_candidates, columns=columns).sort_values(by=['date', 'ticker'], ascending=[False, True])
 
     # Add current price data
-    current_data = df_breakout_candidates['ticker'].apply(lambda ticker: 
-        (
-            round(all_ticker_data[ticker]['1d'].iloc[-1]['Close'], 2),
-            all_ticker_data[ticker]['1d'].iloc[-1].name.strftime('%Y-%m-%d %H:%M:%S')
+    # The latest 1d close and time only depend on the ticker, so look them up once per ticker
+    current_by_ticker = {
+        ticker: (
+            round(all_ticker_data[ticker]['1d']['Close'].iloc[-1], 2),
+            all_ticker_data[ticker]['1d'].index[-1].strftime('%Y-%m-%d %H:%M:%S')
         ) if ticker in all_ticker_data and '1d' in all_ticker_data[ticker] and not all_ticker_data[ticker]['1d'].empty else (None, None)
+        for ticker in df_breakout_candidates['ticker'].unique()
+    }
+    df_breakout_candidates[['current_price', 'current_time']] = pd.DataFrame(
+        [current_by_ticker[ticker] for ticker in df_breakout_candidates['ticker']],
+        index=df_breakout_candidates.index
     )
-    df_breakout_candidates[['current_price', 'current_time']] = pd.DataFrame(current_data.tolist(), index=df_breakout_candidates.index)
 
     # Add NX indicator data for 1h timeframe
     dict_nx_1h = {}
     dict_nx_5m = {}
+    precomputed_nx = {}  # Full NX crossover series per ticker and interval
 
     for ticker in df_breakout_candidates['ticker'].unique():
         # Calculate nx_1h from 1h data
@@ -416,8 +362,9 @@ def identify_5230(data, all_ticker_data):
             short_close = close.ewm(span = 24, adjust=False).mean()
             long_close = close.ewm(span = 89, adjust=False).mean()
             nx_1h = (short_close > long_close) 
+            precomputed_nx.setdefault(ticker, {})['1h'] = nx_1h
 
-            nx_1h.index = nx_1h.index.date
+            nx_1h = nx_1h.set_axis(nx_1h.index.date)
             dict_nx_1h[ticker] = nx_1h.to_dict()
         else:
             print(f"No 1h data found for {ticker} in pre-downloaded data, skipping nx_1h calculation.")
@@ -430,6 +377,7 @@ def identify_5230(data, all_ticker_data):
             short_close_5m = close_5m.ewm(span = 24, adjust=False).mean()
             long_close_5m = close_5m.ewm(span = 89, adjust=False).mean()
             nx_5m = (short_close_5m > long_close_5m) 
+            precomputed_nx.setdefault(ticker, {})['5m'] = nx_5m
 
             # Convert to date and take the last value for each date (end of day value)
             nx_5m_daily = nx_5m.groupby(nx_5m.index.date).last()
@@ -446,23 +394,27 @@ def identify_5230(data, all_ticker_data):
         return df_breakout_candidates  # Return empty DataFrame
     
     # add nx_1h to df_breakout_candidates according to ticker and date
-    df_breakout_candidates['nx_1h_signal'] = df_breakout_candidates.apply(lambda row: dict_nx_1h[row['ticker']].get(row['date'], None), axis=1)
+    df_breakout_candidates['nx_1h_signal'] = [
+        dict_nx_1h[ticker].get(date, None)
+        for ticker, date in zip(df_breakout_candidates['ticker'], df_breakout_candidates['date'])
+    ]
     # add nx_5m to df_breakout_candidates according to ticker and date (optional - may be None if no 5m data)
-    df_breakout_candidates['nx_5m_signal'] = df_breakout_candidates.apply(lambda row: dict_nx_5m[row['ticker']].get(row['date'], None) if row['ticker'] in dict_nx_5m else None, axis=1)
+    df_breakout_candidates['nx_5m_signal'] = [
+        dict_nx_5m[ticker].get(date, None) if ticker in dict_nx_5m else None
+        for ticker, date in zip(df_breakout_candidates['ticker'], df_breakout_candidates['date'])
+    ]
     
     # Add current nx values
-    # Prefer previously computed NX series to avoid recomputation
-    current_nx_data = df_breakout_candidates['ticker'].apply(
-        lambda ticker: calculate_current_nx_values(
-            ticker,
-            all_ticker_data,
-            precomputed_series={
-                '1h': dict_nx_1h.get(ticker),
-            }
-        )
-    )
+    # Current values only depend on the ticker, so compute them once per ticker from the NX series above
+    current_nx_by_ticker = {
+        ticker: calculate_current_nx_values(ticker, all_ticker_data, precomputed_series=precomputed_nx.get(ticker))
+        for ticker in df_breakout_candidates['ticker'].unique()
+    }
     # Assign columns individually to avoid duplicate column issues
-    current_nx_df = pd.DataFrame(current_nx_data.tolist(), index=df_breakout_candidates.index)
+    current_nx_df = pd.DataFrame(
+        [current_nx_by_ticker[ticker] for ticker in df_breakout_candidates['ticker']],
+        index=df_breakout_candidates.index
+    )
     df_breakout_candidates['nx_1d'] = current_nx_df['nx_1d']
     df_breakout_candidates['nx_1h'] = current_nx_df['nx_1h']
     df_breakout_candidates['nx_30m'] = current_nx_df['nx_30m']  
@@ -1,5 +1,10 @@
 import pandas as pd
 import numpy as np
+import weakref
+
+# Indicator results of DataFrames that are still alive, keyed by id() and verified through a weak reference
+INDICATOR_CACHE_MAX_SIZE = 64
+_indicator_cache = {}
 
 def compute_cd_indicator(data):
     # Ensure we get a Series, not a DataFrame column
@@ -17,40 +22,45 @@ def compute_cd_indicator(data):
     slow_ema = close.ewm(span=26, adjust=False).mean()
     diff = fast_ema - slow_ema
     dea = diff.ewm(span=9, adjust=False).mean()
-    mcd = (diff - dea) * 2
+    
+    # Everything after the EMAs runs on plain NumPy arrays instead of chains of intermediate Series
+    close_values = close.to_numpy(dtype=np.float64)
+    diff_values = diff.to_numpy(dtype=np.float64)
+    mcd = (diff_values - dea.to_numpy(dtype=np.float64)) * 2
+    mcd_prev = _shift(mcd, np.nan)
 
     # 计算交叉事件
-    cross_down = (mcd.shift(1) >= 0) & (mcd < 0)
-    cross_up = (mcd.shift(1) <= 0) & (mcd > 0)
+    cross_down = (mcd_prev >= 0) & (mcd < 0)
+    cross_up = (mcd_prev <= 0) & (mcd > 0)
 
     # 计算N1和MM1
-    n1 = _compute_barslast(cross_down, len(data))
-    mm1 = _compute_barslast(cross_up, len(data))
+    n1 = _compute_barslast(cross_down)
+    mm1 = _compute_barslast(cross_up)
 
     # 计算N1_SAFE和MM1_SAFE
     n1_safe = n1 + 1
     mm1_safe = mm1 + 1
 
     # 计算CC系列
-    cc1 = _compute_llv(close, n1_safe)
+    cc1 = _compute_llv(close_values, n1_safe)
     cc2 = _compute_ref(cc1, mm1_safe)
     cc3 = _compute_ref(cc2, mm1_safe)
 
     # 计算DIFL系列
-    difl1 = _compute_llv(diff, n1_safe)
+    difl1 = _compute_llv(diff_values, n1_safe)
     difl2 = _compute_ref(difl1, mm1_safe)
     difl3 = _compute_ref(difl2, mm1_safe)
 
     # 生成条件信号
-    aaa = (cc1 < cc2) & (difl1 > difl2) & (mcd.shift(1) < 0) & (diff < 0)
-    bbb = (cc1 < cc3) & (difl1 < difl2) & (difl1 > difl3) & (mcd.shift(1) < 0) & (diff < 0)
+    aaa = (cc1 < cc2) & (difl1 > difl2) & (mcd_prev < 0) & (diff_values < 0)
+    bbb = (cc1 < cc3) & (difl1 < difl2) & (difl1 > difl3) & (mcd_prev < 0) & (diff_values < 0)
     ccc = aaa | bbb
-    jjj = ccc.shift(1) & (abs(diff.shift(1)) >= abs(diff) * 1.01)
-    dxdx = jjj & ~jjj.shift(1, fill_value=False).fillna(False)
+    jjj = _shift(ccc, False) & (np.abs(_shift(diff_values, np.nan)) >= np.abs(diff_values) * 1.01)
+    dxdx = jjj & ~_shift(jjj, False)
 
     # Mark early periods as NA due to EMA approximation
     # Professional approach: Only show signals when we're confident they're accurate
-    result = dxdx.copy().astype('object')  # Convert to object dtype to allow NaN
+    result = pd.Series(dxdx, index=close.index).astype('object')  # Convert to object dtype to allow NaN
     result.iloc[:ema_warmup_period] = np.nan
     
     return result
@@ -75,49 +85,54 @@ def compute_mc_indicator(data):
     slow_ema = close.ewm(span=26, adjust=False).mean()
     diff = fast_ema - slow_ema
     dea = diff.ewm(span=9, adjust=False).mean()
-    mcd = (diff - dea) * 2
+    
+    # Everything after the EMAs runs on plain NumPy arrays instead of chains of intermediate Series
+    close_values = close.to_numpy(dtype=np.float64)
+    diff_values = diff.to_numpy(dtype=np.float64)
+    mcd = (diff_values - dea.to_numpy(dtype=np.float64)) * 2
+    mcd_prev = _shift(mcd, np.nan)
 
     # 计算交叉事件
-    cross_down = (mcd.shift(1) >= 0) & (mcd < 0)
-    cross_up = (mcd.shift(1) <= 0) & (mcd > 0)
+    cross_down = (mcd_prev >= 0) & (mcd < 0)
+    cross_up = (mcd_prev <= 0) & (mcd > 0)
 
     # 计算N1和MM1
-    n1 = _compute_barslast(cross_down, len(data))
-    mm1 = _compute_barslast(cross_up, len(data))
+    n1 = _compute_barslast(cross_down)
+    mm1 = _compute_barslast(cross_up)
 
     # 计算N1_SAFE和MM1_SAFE
     n1_safe = n1 + 1
     mm1_safe = mm1 + 1
 
     # 计算CH系列 (使用HHV for highest high values)
-    ch1 = _compute_hhv(close, mm1_safe)
+    ch1 = _compute_hhv(close_values, mm1_safe)
     ch2 = _compute_ref(ch1, n1_safe)
     ch3 = _compute_ref(ch2, n1_safe)
 
     # 计算DIFH系列 (使用HHV for highest DIFF values)
-    difh1 = _compute_hhv(diff, mm1_safe)
+    difh1 = _compute_hhv(diff_values, mm1_safe)
     difh2 = _compute_ref(difh1, n1_safe)
     difh3 = _compute_ref(difh2, n1_safe)
 
     # 生成卖出条件信号
     # ZJDBL := CH1 > CH2 AND DIFH1 < DIFH2 AND REF(MCD,1) > 0 AND DIFF > 0;
-    zjdbl = (ch1 > ch2) & (difh1 < difh2) & (mcd.shift(1) > 0) & (diff > 0)
+    zjdbl = (ch1 > ch2) & (difh1 < difh2) & (mcd_prev > 0) & (diff_values > 0)
     
     # GXDBL := CH1 > CH3 AND DIFH1 > DIFH2 AND DIFH1 < DIFH3 AND REF(MCD,1) > 0 AND DIFF > 0;
-    gxdbl = (ch1 > ch3) & (difh1 > difh2) & (difh1 < difh3) & (mcd.shift(1) > 0) & (diff > 0)
+    gxdbl = (ch1 > ch3) & (difh1 > difh2) & (difh1 < difh3) & (mcd_prev > 0) & (diff_values > 0)
     
     # DBBL := (ZJDBL OR GXDBL) AND DIFF > 0;
-    dbbl = (zjdbl | gxdbl) & (diff > 0)
+    dbbl = (zjdbl | gxdbl) & (diff_values > 0)
     
     # DBJG := REF(DBBL,1) AND REF(DIFF,1)>= DIFF * 1.01;
-    dbjg = dbbl.shift(1) & (diff.shift(1) >= diff * 1.01)
+    dbjg = _shift(dbbl, False) & (_shift(diff_values, np.nan) >= diff_values * 1.01)
     
     # DBJGXC := NOT(REF(DBJG,1)) AND DBJG;
-    dbjgxc = dbjg & ~dbjg.shift(1, fill_value=False).fillna(False)
+    dbjgxc = dbjg & ~_shift(dbjg, False)
 
     # Mark early periods as NA due to EMA approximation
     # Professional approach: Only show signals when we're confident they're accurate
-    result = dbjgxc.copy().astype('object')  # Convert to object dtype to allow NaN
+    result = pd.Series(dbjgxc, index=close.index).astype('object')  # Convert to object dtype to allow NaN
     result.iloc[:ema_warmup_period] = np.nan
     
     return result
@@ -135,47 +150,101 @@ def compute_nx_break_through(data):
     break_through = (close > short_upper) & (close.shift(1) <= short_upper.shift(1))
     return break_through
 
-def _compute_barslast(cross_events, length):
-    barslast = np.zeros(length, dtype=int)
-    last_event = -1
-    for i in range(length):
-        # Get scalar boolean value
-        if cross_events.iloc[i].item():
-            last_event = i
-        barslast[i] = i - last_event if last_event != -1 else 0
-    return pd.Series(barslast, index=cross_events.index)
-
-def _compute_llv(series, periods):
-    llv = pd.Series(index=series.index, dtype=float)
-    for i in range(len(series)):
-        period = periods.iloc[i]
-        if period > 0:
-            start = max(0, i - period + 1)
-            llv.iloc[i] = series.iloc[start:i+1].min()
-        else:
-            llv.iloc[i] = np.nan
-    return llv
-
-def _compute_hhv(series, periods):
+def _cached_indicator(compute, data):
+    key = (compute.__name__, id(data), len(data))
+    entry = _indicator_cache.get(key)
+    if entry is not None and entry[0]() is data:
+        return entry[1]
+    
+    result = compute(data)
+    # Drop entries of frames that were garbage collected, then the oldest entry if still full
+    for stale_key in [k for k, (ref, _) in _indicator_cache.items() if ref() is None]:
+        del _indicator_cache[stale_key]
+    if len(_indicator_cache) >= INDICATOR_CACHE_MAX_SIZE:
+        _indicator_cache.pop(next(iter(_indicator_cache)))
+    _indicator_cache[key] = (weakref.ref(data), result)
+    return result
+
+def cached_cd_indicator(data):
+    """
+    compute_cd_indicator, reusing the result while the same DataFrame object is alive.
+    
+    Args:
+        data: DataFrame with price data (must not be modified after the first call)
+    
+    Returns:
+        Series with CD signals (shared between callers, do not modify in place)
+    """
+    return _cached_indicator(compute_cd_indicator, data)
+
+def cached_mc_indicator(data):
+    """
+    compute_mc_indicator, reusing the result while the same DataFrame object is alive.
+    
+    Args:
+        data: DataFrame with price data (must not be modified after the first call)
+    
+    Returns:
+        Series with MC signals (shared between callers, do not modify in place)
+    """
+    return _cached_indicator(compute_mc_indicator, data)
+
+def _shift(values, fill_value):
+    # REF(X, 1): values moved one bar later, with fill_value on the first bar
+    shifted = np.empty_like(values)
+    shifted[:1] = fill_value
+    shifted[1:] = values[:-1]
+    return shifted
+
+def _compute_barslast(cross_events):
+    positions = np.arange(len(cross_events))
+    # Position of the latest event at or before each bar (-1 before the first event)
+    last_event = np.maximum.accumulate(np.where(cross_events, positions, -1))
+    return np.where(last_event != -1, positions - last_event, 0)
+
+def _rolling_extreme(values, periods, reduce):
+    """
+    Reduce values over a trailing window of periods[i] bars ending at each bar, skipping NaN.
+    
+    Args:
+        values: NumPy float array
+        periods: NumPy integer array of window lengths, one per bar (bars with a length <= 0 get NaN)
+        reduce: np.fmin or np.fmax
+    
+    Returns:
+        NumPy float array with the reduced value of every window
+    """
+    length = len(values)
+    positions = np.arange(length)
+    # Windows with a length <= 0 are masked out below; clamp them to one bar so indexing stays in range
+    starts = np.clip(positions - periods + 1, 0, positions)
+    
+    # Sparse table: row k holds the reduction over the 2**k bars starting at each position, so any
+    # window is covered by two (possibly overlapping) power-of-two blocks
+    n_levels = max(1, length.bit_length())
+    table = np.full((n_levels, length), np.nan)
+    table[0] = values
+    for level in range(1, n_levels):
+        half = 2 ** (level - 1)
+        reduce(table[level - 1, :length - half], table[level - 1, half:], out=table[level, :length - half])
+    
+    levels = np.frexp(positions - starts + 1)[1] - 1  # floor(log2(window length))
+    extreme = reduce(table[levels, starts], table[levels, positions - 2 ** levels + 1])
+    return np.where(periods > 0, extreme, np.nan)
+
+def _compute_llv(values, periods):
+    return _rolling_extreme(values, periods, np.fmin)
+
+def _compute_hhv(values, periods):
     """
     计算HHV (Highest High Value) - 最高值
     """
-    hhv = pd.Series(index=series.index, dtype=float)
-    for i in range(len(series)):
-        period = periods.iloc[i]
-        if period > 0:
-            start = max(0, i - period + 1)
-            hhv.iloc[i] = series.iloc[start:i+1].max()
-        else:
-            hhv.iloc[i] = np.nan
-    return hhv
-
-def _compute_ref(series, lags):
-    ref = pd.Series(index=series.index, dtype=float)
-    for i in range(len(series)):
-        lag = lags.iloc[i]
-        if lag <= i:
-            ref.iloc[i] = series.iloc[i - lag]
-        else:
-            ref.iloc[i] = np.nan
+    return _rolling_extreme(values, periods, np.fmax)
+
+def _compute_ref(values, lags):
+    source = np.arange(len(values)) - lags
+    # Bars whose lag reaches back before the first bar have no reference value
+    valid = source >= 0
+    ref = np.full(len(values), np.nan)
+    ref[valid] = values[source[valid]]
     return ref
\ No newline at end of file
@@ -67,6 +67,12 @@ mc_best_intervals_columns = ['ticker', 'interval', 'hold_time',
 # Define all periods for dynamic handling
 periods = [0] + list(range(1, 101))  # Full range from 0 to 100
 
+# Intervals of each ticker's price data that the parent process still reads after the pool
+# (breakout candidates and current NX values); the rest stay in the worker
+parent_data_intervals = ['1d', '1h', '30m', '5m']
+# The parent only reads closing prices (and the index) of those frames
+parent_data_columns = ['Close']
+
 # Define period ranges for different best intervals tables
 period_ranges = {
     '20': list(range(20)),
@@ -149,6 +155,36 @@ def format_hold_time(total_minutes):
     result = "".join(result) if result else "0min"
     return result
 
+def select_best_period_values(df, prefix):
+    """
+    Pick, for every row, the value of its {prefix}_{best_period} column.
+    
+    Args:
+        df: DataFrame with a best_period column and per-period columns
+        prefix: Per-period column prefix, e.g. 'test_count'
+    
+    Returns:
+        Series aligned with df's index
+    """
+    best_periods = df['best_period'].to_numpy()
+    used_periods = np.unique(best_periods)
+    # One block with just the columns some row needs, indexed by (row, position of the row's period)
+    values = df[[f'{prefix}_{period}' for period in used_periods]].to_numpy()
+    return pd.Series(values[np.arange(len(df)), np.searchsorted(used_periods, best_periods)], index=df.index)
+
+def best_period_hold_times(df):
+    """
+    Format the hold time of every row from its interval and best_period.
+    
+    Args:
+        df: DataFrame with interval and best_period columns
+    
+    Returns:
+        List of hold time strings, one per row
+    """
+    return [format_hold_time(parse_interval_to_minutes(interval) * best_period)
+            for interval, best_period in zip(df['interval'], df['best_period'])]
+
 # Move this function outside the analyze_stocks function so it can be pickled
 def process_ticker_all(ticker, end_date=None):
     """Process a single ticker for all analysis types"""
@@ -194,7 +230,13 @@ def process_ticker_all(ticker, end_date=None):
             if result:
                 mc_results.append(result)
         
-        return ticker, results_1234, results_5230, mc_results_1234, mc_results_5230, cd_results, mc_results, data
+        # Only ship the intervals and columns the parent needs back through the pool, instead of every frame
+        parent_data = {
+            interval: data[interval][parent_data_columns] if not data[interval].empty else data[interval]
+            for interval in parent_data_intervals if interval in data
+        }
+        
+        return ticker, results_1234, results_5230, mc_results_1234, mc_results_5230, cd_results, mc_results, parent_data
         
     except Exception as e:
         print(f"Error processing {ticker}: {e}")
@@ -253,14 +295,17 @@ def analyze_stocks(file_path, end_date=None, progress_callback=None):
     
     # Use multiprocessing
     num_processes = max(1, cpu_count() - 1)
+    # Recycle workers periodically to bound the growth of their per-process caches (history, signals)
+    max_tasks_per_child = 50
     logger.info(f"Using {num_processes} processes for analysis")
     
     try:
-        with Pool(num_processes) as pool:
+        with Pool(num_processes, maxtasksperchild=max_tasks_per_child) as pool:
             # Create a partial function with fixed arguments
             process_func = functools.partial(process_ticker_all, end_date=end_date)
             
-            # Map the function to the tickers using imap for progress tracking
+            # Map the function to the tickers using imap_unordered for progress tracking; slow tickers
+            # no longer hold back the results queued behind them
             total_tickers = len(tickers)
             processed_count = 0
             
@@ -268,10 +313,10 @@ def analyze_stocks(file_path, end_date=None, progress_callback=None):
                 progress_callback(0)
             
             # Use chunks for better performance but iterate one by one for progress
-            # chunksize heuristic
-            chunk_size = max(1, total_tickers // (num_processes * 4))
+            # chunksize heuristic, capped so a chunk of slow tickers can't leave one worker straggling
+            chunk_size = max(1, min(4, total_tickers // (num_processes * 4)))
             
-            for result in pool.imap(process_func, tickers, chunksize=chunk_size):
+            for result in pool.imap_unordered(process_func, tickers, chunksize=chunk_size):
                 results.append(result)
                 processed_count += 1
                 
@@ -285,6 +330,10 @@ def analyze_stocks(file_path, end_date=None, progress_callback=None):
                 
         logger.info("All tickers processed. Aggregating results...")
         
+        # Restore the stock list order (results arrive in completion order)
+        ticker_order = {ticker: i for i, ticker in enumerate(tickers)}
+        results.sort(key=lambda res: ticker_order.get(res[0], total_tickers) if res else total_tickers)
+        
         # Separate results
         cd_results = []
         mc_results = []
@@ -458,15 +507,13 @@ def analyze_stocks(file_path, end_date=None, progress_callback=None):
                     
                     best_intervals = range_df.loc[range_df.groupby('ticker')['max_return'].idxmax()]
                     best_intervals = best_intervals.assign(
-                        test_count=best_intervals.apply(lambda x: x[f'test_count_{int(x.best_period)}'], axis=1),
-                        success_rate=best_intervals.apply(lambda x: x[f'success_rate_{int(x.best_period)}'], axis=1),
+                        test_count=select_best_period_values(best_intervals, 'test_count'),
+                        success_rate=select_best_period_values(best_intervals, 'success_rate'),
                         avg_return=best_intervals['max_return']
                     )
                     available_columns = [col for col in best_intervals_columns if col in best_intervals.columns]
                     best_intervals = best_intervals[available_columns].sort_values('latest_signal', ascending=False)
-                    best_intervals['hold_time'] = best_intervals.apply(
-                        lambda row: format_hold_time(parse_interval_to_minutes(row['interval']) * row['best_period']), axis=1
-                    )
+                    best_intervals['hold_time'] = best_period_hold_times(best_intervals)
                     final_columns = [col for col in best_intervals_columns if col in best_intervals.columns]
                     best_intervals = best_intervals[final_columns]
                     best_intervals = best_intervals[best_intervals['avg_return'] >= 5]
@@ -484,13 +531,11 @@ def analyze_stocks(file_path, end_date=None, progress_callback=None):
                 avg_return_cols = [f'avg_return_{period}' for period in periods if f'avg_return_{period}' in good_signals.columns]
                 good_signals['max_return'] = good_signals[avg_return_cols].max(axis=1)
                 good_signals['best_period'] = good_signals[avg_return_cols].idxmax(axis=1).str.extract('(\d+)').astype(int)
-                good_signals['hold_time'] = good_signals.apply(
-                    lambda row: format_hold_time(parse_interval_to_minutes(row['interval']) * row['best_period']), axis=1
-                )
-                good_signals['exp_return'] = good_signals.apply(lambda row: row[f'avg_return_{int(row.best_period)}'], axis=1)
+                good_signals['hold_time'] = best_period_hold_times(good_signals)
+                good_signals['exp_return'] = select_best_period_values(good_signals, 'avg_return')
                 good_signals['avg_return'] = good_signals['exp_return']
-                good_signals['test_count'] = good_signals.apply(lambda row: row[f'test_count_{int(row.best_period)}'], axis=1)
-                good_signals['success_rate'] = good_signals.apply(lambda row: row[f'success_rate_{int(row.best_period)}'], axis=1)
+                good_signals['test_count'] = select_best_period_values(good_signals, 'test_count')
+                good_signals['success_rate'] = select_best_period_values(good_signals, 'success_rate')
                 available_good_columns = [col for col in best_intervals_columns if col in good_signals.columns]
                 good_signals = good_signals[available_good_columns]
                 good_signals = good_signals[good_signals['success_rate'] >= 50]
@@ -573,15 +618,13 @@ def analyze_stocks(file_path, end_date=None, progress_callback=None):
                     range_df['best_period'] = range_df[avg_return_cols].idxmin(axis=1).str.extract('(\d+)').astype(int)
                     best_intervals = range_df.loc[range_df.groupby('ticker')['min_return'].idxmin()]
                     best_intervals = best_intervals.assign(
-                        test_count=best_intervals.apply(lambda x: x[f'test_count_{int(x.best_period)}'], axis=1),
-                        success_rate=best_intervals.apply(lambda x: x[f'success_rate_{int(x.best_period)}'], axis=1),
+                        test_count=select_best_period_values(best_intervals, 'test_count'),
+                        success_rate=select_best_period_values(best_intervals, 'success_rate'),
                         avg_return=best_intervals['min_return']
                     )
                     available_columns = [col for col in mc_best_intervals_columns if col in best_intervals.columns]
                     best_intervals = best_intervals[available_columns].sort_values('latest_signal', ascending=False)
-                    best_intervals['hold_time'] = best_intervals.apply(
-                        lambda row: format_hold_time(parse_interval_to_minutes(row['interval']) * row['best_period']), axis=1
-                    )
+                    best_intervals['hold_time'] = best_period_hold_times(best_intervals)
                     final_columns = [col for col in mc_best_intervals_columns if col in best_intervals.columns]
                     best_intervals = best_intervals[final_columns]
                     best_intervals = best_intervals[best_intervals['avg_return'] <= -5]
@@ -597,13 +640,11 @@ def analyze_stocks(file_path, end_date=None, progress_callback=None):
                 avg_return_cols = [f'avg_return_{period}' for period in periods if f'avg_return_{period}' in good_signals.columns]
                 good_signals['min_return'] = good_signals[avg_return_cols].min(axis=1)
                 good_signals['best_period'] = good_signals[avg_return_cols].idxmin(axis=1).str.extract('(\d+)').astype(int)
-                good_signals['hold_time'] = good_signals.apply(
-                    lambda row: format_hold_time(parse_interval_to_minutes(row['interval']) * row['best_period']), axis=1
-                )
-                good_signals['exp_return'] = good_signals.apply(lambda row: row[f'avg_return_{int(row.best_period)}'], axis=1)
+                good_signals['hold_time'] = best_period_hold_times(good_signals)
+                good_signals['exp_return'] = select_best_period_values(good_signals, 'avg_return')
                 good_signals['avg_return'] = good_signals['exp_return']
-                good_signals['test_count'] = good_signals.apply(lambda row: row[f'test_count_{int(row.best_period)}'], axis=1)
-                good_signals['success_rate'] = good_signals.apply(lambda row: row[f'success_rate_{int(row.best_period)}'], axis=1)
+                good_signals['test_count'] = select_best_period_values(good_signals, 'test_count')
+                good_signals['success_rate'] = select_best_period_values(good_signals, 'success_rate')
                 available_good_columns = [col for col in mc_best_intervals_columns if col in good_signals.columns]
                 good_signals = good_signals[available_good_columns]
                 good_signals = good_signals[good_signals['success_rate'] >= 50]
@@ -61,6 +61,86 @@ def get_trading_day_window_end(start_date, ticker, all_ticker_data, days=3):
         # print(f"Error calculating trading window: {e}")
         return fallback_date
 
+def find_resonance_candidates(df, required_intervals, all_ticker_data, unit, days=3):
+    """
+    Sweep each ticker's signals for trading-day windows in which at least three
+    of the required intervals fire.
+
+    Every unique signal date is used as a window start. Rather than re-filtering
+    the whole DataFrame per start date, the signals are grouped by ticker once and
+    each window is resolved with searchsorted plus an OR over per-signal interval bitmasks.
+
+    Args:
+        df (pd.DataFrame): Signals with 'ticker', 'interval', 'signal_date' and 'date' columns.
+        required_intervals (set): Intervals that count towards resonance.
+        all_ticker_data (dict): Dictionary of ticker data.
+        unit (str): Interval suffix stripped when formatting, e.g. 'h' or 'm'.
+        days (int): Number of trading days in the window.
+
+    Returns:
+        list: [ticker, date, intervals, signal_price] rows, one per (ticker, most recent signal date).
+    """
+    df = df[df['signal_date'].notna()]
+    if df.empty:
+        return []
+
+    intervals = sorted(required_intervals, key=lambda s: int(s.replace(unit, '')))
+    bits = {interval: 1 << i for i, interval in enumerate(intervals)}
+
+    tickers = df['ticker'].to_numpy()
+    ticker_codes, ticker_names = pd.factorize(tickers)
+    dates = df['date'].to_numpy(dtype='datetime64[D]')
+    timestamps = pd.DatetimeIndex(df['signal_date']).as_unit('ns').asi8
+    masks = df['interval'].map(bits).to_numpy(dtype=np.int64)
+    prices = df['signal_price'].to_numpy() if 'signal_price' in df.columns else None
+    window_starts = np.unique(dates)
+    broad_ends = window_starts + np.timedelta64(10, 'D')
+
+    # Stable sort keeps the original row order among identical timestamps, so the
+    # first row with the latest timestamp matches idxmax on the unsorted frame
+    order = np.lexsort((timestamps, ticker_codes))
+    group_bounds = np.flatnonzero(np.diff(ticker_codes[order])) + 1
+
+    found = []
+    for rows in np.split(order, group_bounds):
+        ticker = ticker_names[ticker_codes[rows[0]]]
+        t_dates = dates[rows]
+        t_timestamps = timestamps[rows]
+        t_masks = masks[rows]
+        starts = np.searchsorted(t_dates, window_starts, side='left')
+        broad_stops = np.searchsorted(t_dates, broad_ends, side='left')
+        seen = set()
+
+        for k in np.flatnonzero(broad_stops > starts):
+            lo = starts[k]
+            window_start = window_starts[k]
+            precise_end_date = get_trading_day_window_end(window_start.item(), ticker, all_ticker_data, days=days)
+            # precise_end is inclusive day
+            stop = min(np.datetime64(precise_end_date, 'D') + np.timedelta64(1, 'D'), broad_ends[k])
+            hi = np.searchsorted(t_dates, stop, side='left')
+            if hi <= lo:
+                continue
+
+            mask = int(np.bitwise_or.reduce(t_masks[lo:hi]))
+            if bin(mask).count('1') < 3:
+                continue
+
+            latest = np.searchsorted(t_timestamps, t_timestamps[hi - 1], side='left')
+            most_recent_signal_date = t_dates[latest].item()
+            if most_recent_signal_date in seen:
+                continue
+            seen.add(most_recent_signal_date)
+
+            intervals_str = ",".join(interval.replace(unit, '') for interval in intervals if mask & bits[interval])
+            latest_signal_price = prices[rows[latest]] if prices is not None else None
+            # Order as the date-by-date sweep did: start date first, then the
+            # ticker's first appearance within the broad window
+            first_seen = rows[lo:broad_stops[k]].min()
+            found.append((k, first_seen, [ticker, most_recent_signal_date, intervals_str, latest_signal_price]))
+
+    found.sort(key=lambda item: (item[0], item[1]))
+    return [candidate for _, _, candidate in found]
+
 def save_results(results, output_file):
     df = pd.DataFrame(results)
     if df.empty:
@@ -242,7 +322,8 @@ def calculate_current_nx_values(ticker, all_ticker_data, precomputed_series=None
         ticker: Stock symbol
         all_ticker_data: Dictionary containing ticker data
         precomputed_series: Optional dictionary of precomputed boolean series to avoiding recalculation
-                           Format: {'1d': series, '1h': series, ...}
+                           Format: {'1d': series, '1h': series, ...}, each the NX crossover of
+                           the same all_ticker_data frame in bar order
     
     Returns:
         dict: Dictionary with 'nx_1d', 'nx_1h', 'nx_30m', 'nx_5m' boolean values
@@ -262,13 +343,12 @@ def calculate_current_nx_values(ticker, all_ticker_data, precomputed_series=None
     # Helper to calculate or reuse NX value
     def get_nx_value(interval, key):
         # Try to use precomputed series logic
-        if key in precomputed and precomputed[key] is not None:
-            # precomputed[key] is a dict {date: bool} or Series
-            # We want current status (latest available)
-            # This is tricky because precomputed used date keys.
-            # So fallback to recalculation is safer for "current status" unless dates align perfectly.
-            pass
-            
+        precomputed_nx = precomputed.get(key)
+        if isinstance(precomputed_nx, pd.Series) and not precomputed_nx.empty:
+            # A full per-bar series ends at the latest bar, which is the current status
+            return bool(precomputed_nx.iloc[-1])
+        # Date-keyed dicts may collapse bars, so fall back to recalculation for anything else
+
         if interval in all_ticker_data[ticker] and not all_ticker_data[ticker][interval].empty:
             df = all_ticker_data[ticker][interval]
             close = df['Close']
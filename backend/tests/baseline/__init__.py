@@ -0,0 +1,6 @@
+"""
+Reference copies of the signal evaluators and indicators before they were vectorized.
+
+The equivalence tests run these next to the current modules on the same price data. Leave them unchanged
+unless the intended output of the current modules changes.
+"""
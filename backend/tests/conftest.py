@@ -0,0 +1,15 @@
+import os
+import sys
+
+import pandas as pd
+
+# The logic modules import each other as flat modules (from indicators import ...), the analyzer as app.logic;
+# the backend directory goes first so that app resolves to the package, not app/logic/app.py
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(TESTS_DIR)
+sys.path.insert(0, os.path.join(BACKEND_DIR, 'app', 'logic'))
+sys.path.insert(0, TESTS_DIR)
+sys.path.insert(0, BACKEND_DIR)
+
+# Same pandas option the analyzer sets at import
+pd.set_option('future.no_silent_downcasting', True)
@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+
+def make_ohlcv(seed, n=400, freq='1h', base=100.0):
+    """
+    Build a random-walk OHLCV frame shaped like the yfinance history frames.
+    
+    Args:
+        seed: Random seed
+        n: Number of bars
+        freq: Bar frequency of the DatetimeIndex
+        base: Starting price
+    
+    Returns:
+        DataFrame with Open, High, Low, Close and Volume columns
+    """
+    rng = np.random.default_rng(seed)
+    index = pd.date_range('2024-01-02 09:30', periods=n, freq=freq, tz='America/New_York')
+    close = base * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = close * (1 + rng.normal(0, 0.003, n))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.004, n)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.004, n)))
+    volume = rng.integers(1000, 100000, n).astype(np.int64)
+    return pd.DataFrame({'Open': open_, 'High': high, 'Low': low, 'Close': close, 'Volume': volume}, index=index)
+
+def with_nan_bars(frame, seed, count=12):
+    """
+    Copy of frame with the prices of some bars set to NaN, like the gaps in yfinance intraday history.
+    
+    Args:
+        frame: OHLCV DataFrame
+        seed: Random seed choosing the bars
+        count: Number of bars to blank out
+    
+    Returns:
+        DataFrame with NaN Open/High/Low/Close on the chosen bars
+    """
+    rng = np.random.default_rng(seed)
+    frame = frame.copy()
+    rows = rng.choice(np.arange(50, len(frame)), size=count, replace=False)
+    frame.iloc[rows, frame.columns.get_indexer(['Open', 'High', 'Low', 'Close'])] = np.nan
+    return frame
+
+def with_new_prices(frame, seed):
+    """
+    Frame with the same index and length as frame but different prices, to catch results cached by shape.
+    
+    Args:
+        frame: OHLCV DataFrame
+        seed: Random seed of the new prices
+    
+    Returns:
+        DataFrame with the index of frame and freshly drawn prices and volumes
+    """
+    other = make_ohlcv(seed, n=len(frame), base=float(frame['Close'].iloc[0]))
+    other.index = frame.index
+    return other
+
+def assert_same_result(actual, expected, path='result'):
+    """
+    Assert that two evaluator results are equal, treating NaN as equal to NaN and comparing floats exactly.
+    """
+    if isinstance(expected, dict):
+        assert isinstance(actual, dict), path
+        assert list(actual) == list(expected), path
+        for key in expected:
+            assert_same_result(actual[key], expected[key], f'{path}[{key!r}]')
+    elif isinstance(expected, (list, tuple)):
+        assert len(actual) == len(expected), path
+        for i, (a, e) in enumerate(zip(actual, expected)):
+            assert_same_result(a, e, f'{path}[{i}]')
+    elif isinstance(expected, (float, np.floating)) and np.isnan(expected):
+        assert isinstance(actual, (float, np.floating)) and np.isnan(actual), f'{path}: {actual!r} != nan'
+    else:
+        assert actual == expected, f'{path}: {actual!r} != {expected!r}'
+
+def make_ticker_data(seed):
+    """
+    Build a data dict shaped like download_stock_data's, with the derived intervals built from random 5m/1h/1d bars.
+    
+    Args:
+        seed: Random seed
+    
+    Returns:
+        Dictionary mapping each interval to its OHLCV DataFrame
+    """
+    from data_loader import transform_1h_data, transform_5m_data
+    
+    days = pd.bdate_range('2024-01-02', periods=300, tz='America/New_York')
+    
+    def intraday(frame, step, bars_per_day, day_count):
+        # Regular-session timestamps of the last day_count days
+        frame.index = pd.DatetimeIndex([day + pd.Timedelta(hours=9, minutes=30) + step * k
+                                        for day in days[-day_count:] for k in range(bars_per_day)])
+        return frame
+    
+    data = {
+        '5m': intraday(make_ohlcv(seed, n=25 * 78), pd.Timedelta(minutes=5), 78, 25),
+        '1h': intraday(make_ohlcv(seed + 1, n=150 * 7), pd.Timedelta(hours=1), 7, 150),
+        '1d': make_ohlcv(seed + 2, n=len(days)).set_axis(days),
+    }
+    for interval in ['10m', '15m', '30m']:
+        data[interval] = transform_5m_data(data['5m'], interval)
+    for interval in ['2h', '3h', '4h']:
+        data[interval] = transform_1h_data(data['1h'], interval)
+    data['1w'] = data['1d'].resample('W').agg({'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last',
+                                               'Volume': 'sum'})
+    return data
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import get_best_CD_interval
+from baseline import get_best_CD_interval as baseline_cd
+from baseline.indicators import compute_cd_indicator
+from frames import assert_same_result, make_ohlcv, with_nan_bars, with_new_prices
+
+SEEDS = [0, 1, 2, 3]
+
+def price_frame(seed, case):
+    frame = make_ohlcv(seed, n=600)
+    return with_nan_bars(frame, seed) if case == 'nan_bars' else frame
+
+@pytest.mark.parametrize('case', ['clean', 'nan_bars'])
+@pytest.mark.parametrize('seed', SEEDS)
+def test_calculate_returns_matches_baseline(seed, case):
+    frame = price_frame(seed, case)
+    cd_signals = compute_cd_indicator(frame)
+
+    expected = baseline_cd.calculate_returns(frame, cd_signals)
+    actual = get_best_CD_interval.calculate_returns(frame, cd_signals)
+
+    assert len(expected) > 0
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+def test_calculate_returns_keeps_missing_volumes_as_nan():
+    frame = make_ohlcv(4, n=600)
+    cd_signals = compute_cd_indicator(frame)
+    signal_idx = np.flatnonzero(cd_signals.fillna(False).infer_objects(copy=False).to_numpy(dtype=bool))
+    # Bars without volume inside the windows of the earlier signals
+    missing = signal_idx[:-1] + 3
+    frame['Volume'] = frame['Volume'].astype(np.float64)
+    frame.iloc[missing, frame.columns.get_loc('Volume')] = np.nan
+
+    returns = get_best_CD_interval.calculate_returns(frame, cd_signals)
+    volumes = returns['volume_3'].to_numpy()
+
+    expected = frame['Volume'].to_numpy()[frame.index.get_indexer(returns['date']) + 3]
+    np.testing.assert_array_equal(volumes, expected)
+    assert np.isnan(volumes).any()
+
+@pytest.mark.parametrize('case', ['clean', 'nan_bars'])
+@pytest.mark.parametrize('seed', SEEDS)
+def test_evaluate_interval_matches_baseline(seed, case):
+    frame = price_frame(seed, case)
+
+    expected = baseline_cd.evaluate_interval('TEST', '1h', data={'1h': frame})
+    actual = get_best_CD_interval.evaluate_interval('TEST', '1h', data={'1h': frame})
+
+    assert expected is not None
+    assert_same_result(actual, expected)
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_evaluate_interval_same_length_different_prices(seed):
+    # Frames with the same index and length must not share results through any cache
+    frame = make_ohlcv(seed, n=600)
+    other = with_new_prices(frame, seed + 100)
+
+    for data_frame in [frame, other, frame]:
+        expected = baseline_cd.evaluate_interval('TEST', '1h', data={'1h': data_frame})
+        actual = get_best_CD_interval.evaluate_interval('TEST', '1h', data={'1h': data_frame})
+        assert_same_result(actual, expected)
+
+@pytest.mark.parametrize('case', ['clean', 'nan_bars'])
+@pytest.mark.parametrize('seed', SEEDS)
+def test_evaluate_mc_at_top_price_matches_baseline(seed, case):
+    frame = price_frame(seed, case)
+    rng = np.random.default_rng(seed)
+    for _ in range(40):
+        mc_pos, cd_pos = sorted(rng.integers(0, len(frame), size=2))
+        mc_date, cd_date = frame.index[mc_pos], frame.index[cd_pos]
+        mc_price = frame['Close'].iloc[mc_pos]
+
+        expected = baseline_cd.evaluate_mc_at_top_price(frame, mc_date, mc_price, cd_date)
+        actual = get_best_CD_interval.evaluate_mc_at_top_price(frame, mc_date, mc_price, cd_date)
+
+        assert_same_result(actual, expected)
+
+def test_evaluate_interval_downloads_interval_missing_from_data(monkeypatch):
+    frame = make_ohlcv(5, n=600)
+    daily = make_ohlcv(6, n=300, freq='1D')
+    downloads = []
+
+    def fake_download(ticker, end_date=None):
+        downloads.append(ticker)
+        return {'1h': frame}
+
+    monkeypatch.setattr(get_best_CD_interval, 'download_stock_data', fake_download)
+    monkeypatch.setattr(baseline_cd, 'download_stock_data', fake_download)
+
+    expected = baseline_cd.evaluate_interval('TEST', '1h', data={'1d': daily})
+    actual = get_best_CD_interval.evaluate_interval('TEST', '1h', data={'1d': daily})
+
+    assert downloads == ['TEST', 'TEST']
+    assert actual is not None
+    assert_same_result(actual, expected)
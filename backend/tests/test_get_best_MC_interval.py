@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import get_best_MC_interval
+from baseline import get_best_MC_interval as baseline_mc
+from baseline.indicators import compute_mc_indicator
+from frames import assert_same_result, make_ohlcv, with_nan_bars, with_new_prices
+
+SEEDS = [0, 1, 2, 4]
+
+def price_frame(seed, case):
+    frame = make_ohlcv(seed, n=600)
+    return with_nan_bars(frame, seed) if case == 'nan_bars' else frame
+
+@pytest.mark.parametrize('case', ['clean', 'nan_bars'])
+@pytest.mark.parametrize('seed', SEEDS)
+def test_calculate_returns_matches_baseline(seed, case):
+    frame = price_frame(seed, case)
+    mc_signals = compute_mc_indicator(frame)
+
+    expected = baseline_mc.calculate_returns(frame, mc_signals)
+    actual = get_best_MC_interval.calculate_returns(frame, mc_signals)
+
+    assert len(expected) > 0
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+def test_calculate_returns_keeps_missing_volumes_as_nan():
+    frame = make_ohlcv(4, n=600)
+    mc_signals = compute_mc_indicator(frame)
+    signal_idx = np.flatnonzero(mc_signals.fillna(False).infer_objects(copy=False).to_numpy(dtype=bool))
+    # Bars without volume inside the windows of the earlier signals
+    missing = signal_idx[:-1] + 3
+    frame['Volume'] = frame['Volume'].astype(np.float64)
+    frame.iloc[missing, frame.columns.get_loc('Volume')] = np.nan
+
+    returns = get_best_MC_interval.calculate_returns(frame, mc_signals)
+    volumes = returns['volume_3'].to_numpy()
+
+    expected = frame['Volume'].to_numpy()[frame.index.get_indexer(returns['date']) + 3]
+    np.testing.assert_array_equal(volumes, expected)
+    assert np.isnan(volumes).any()
+
+@pytest.mark.parametrize('case', ['clean', 'nan_bars'])
+@pytest.mark.parametrize('seed', SEEDS)
+def test_evaluate_interval_matches_baseline(seed, case):
+    frame = price_frame(seed, case)
+
+    expected = baseline_mc.evaluate_interval('TEST', '1h', data={'1h': frame})
+    actual = get_best_MC_interval.evaluate_interval('TEST', '1h', data={'1h': frame})
+
+    assert expected is not None
+    assert_same_result(actual, expected)
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_evaluate_interval_same_length_different_prices(seed):
+    # Frames with the same index and length must not share results through any cache
+    frame = make_ohlcv(seed, n=600)
+    other = with_new_prices(frame, seed + 100)
+
+    for data_frame in [frame, other, frame]:
+        expected = baseline_mc.evaluate_interval('TEST', '1h', data={'1h': data_frame})
+        actual = get_best_MC_interval.evaluate_interval('TEST', '1h', data={'1h': data_frame})
+        assert_same_result(actual, expected)
+
+def test_evaluate_interval_downloads_interval_missing_from_data(monkeypatch):
+    frame = make_ohlcv(5, n=600)
+    daily = make_ohlcv(6, n=300, freq='1D')
+    downloads = []
+
+    def fake_download(ticker, end_date=None):
+        downloads.append(ticker)
+        return {'1h': frame}
+
+    monkeypatch.setattr(get_best_MC_interval, 'download_stock_data', fake_download)
+    monkeypatch.setattr(baseline_mc, 'download_stock_data', fake_download)
+
+    expected = baseline_mc.evaluate_interval('TEST', '1h', data={'1d': daily})
+    actual = get_best_MC_interval.evaluate_interval('TEST', '1h', data={'1d': daily})
+
+    assert downloads == ['TEST', 'TEST']
+    assert actual is not None
+    assert_same_result(actual, expected)
+
+def test_evaluate_interval_without_signals_matches_baseline():
+    # Flat prices never produce an MC signal, so every per-period key comes from the empty-result template
+    frame = make_ohlcv(0, n=300)
+    frame[['Open', 'High', 'Low', 'Close']] = 100.0
+
+    expected = baseline_mc.evaluate_interval('TEST', '1h', data={'1h': frame})
+    actual = get_best_MC_interval.evaluate_interval('TEST', '1h', data={'1h': frame})
+
+    assert expected['signal_count'] == 0
+    assert_same_result(actual, expected)
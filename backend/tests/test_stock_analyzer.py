@@ -0,0 +1,24 @@
+import copy
+
+import pandas as pd
+
+from app.logic import stock_analyzer
+from frames import make_ticker_data
+
+def test_parent_data_gives_the_same_breakouts(monkeypatch):
+    data = make_ticker_data(2)
+    monkeypatch.setattr(stock_analyzer, 'download_stock_data', lambda ticker, end_date=None: data)
+    monkeypatch.setattr(stock_analyzer, 'save_price_history', lambda *args, **kwargs: None)
+
+    ticker, r_1234, r_5230, mc_r_1234, mc_r_5230, _, _, parent_data = stock_analyzer.process_ticker_all('TEST')
+
+    assert set(parent_data) == set(stock_analyzer.parent_data_intervals)
+    assert all(set(frame.columns) == set(stock_analyzer.parent_data_columns) for frame in parent_data.values())
+    for identify, rows in [(stock_analyzer.identify_1234, r_1234), (stock_analyzer.identify_5230, r_5230),
+                           (stock_analyzer.identify_mc_1234, mc_r_1234),
+                           (stock_analyzer.identify_mc_5230, mc_r_5230)]:
+        # The breakout tables built from the trimmed frames must match the ones built from every frame
+        expected = identify(copy.deepcopy(rows), {ticker: data})
+        actual = identify(copy.deepcopy(rows), {ticker: parent_data})
+        assert len(expected) > 0
+        pd.testing.assert_frame_equal(actual, expected)